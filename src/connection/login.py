@@ -2,6 +2,7 @@ from typing import Any, Dict
 from utils.mcp_client import mcp
 from utils.logger import logger
 from utils.mt5_client import mt5
+from utils.symbol_cache import reset_symbol_caches
 
 @mcp.tool()
 def login(login: int, password: str, server: str) -> Dict[str, Any]:
@@ -31,6 +32,8 @@ def login(login: int, password: str, server: str) -> Dict[str, Any]:
     logger.info(f"Authorization result: {authorized}")
     
     if authorized:
+        # Another account or server may quote the same symbols with different specs.
+        reset_symbol_caches()
         logger.info(f"Successfully logged in to account {login} on server {server}.")
         return {
             "status": "success",
@@ -2,6 +2,7 @@ from typing import Any, Dict
 from utils.mcp_client import mcp
 from utils.logger import logger
 from utils.mt5_client import mt5
+from utils.symbol_cache import reset_symbol_caches
 
 @mcp.tool()
 def shutdown() -> Dict[str, Any]:   
@@ -17,6 +18,7 @@ def shutdown() -> Dict[str, Any]:
     logger.info("Shutting down MT5...")
     
     if mt5.shutdown():
+        reset_symbol_caches()
         logger.info("MT5 shutdown successfully")
         return {
             "status": "success",
@@ -0,0 +1,132 @@
+from typing import List, Optional, Sequence
+import numpy as np
+from utils.mt5_client import mt5
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the kernels below run as plain Python without it
+    def njit(*args, **kwargs):
+        return lambda fn: fn
+    prange = range
+
+_BUY_LIMIT = mt5.ORDER_TYPE_BUY_LIMIT
+_SELL_LIMIT = mt5.ORDER_TYPE_SELL_LIMIT
+_BUY_STOP = mt5.ORDER_TYPE_BUY_STOP
+_SELL_STOP = mt5.ORDER_TYPE_SELL_STOP
+_BUY_STOP_LIMIT = mt5.ORDER_TYPE_BUY_STOP_LIMIT
+_SELL_STOP_LIMIT = mt5.ORDER_TYPE_SELL_STOP_LIMIT
+
+# Error code -> message template; index 0 means the order passed validation.
+_ERR_MSG_TEMPLATES = (
+    None,
+    "BUY_LIMIT requires price < market_price ({p} ≥ {mp})",
+    "BUY_LIMIT requires stop_loss < price ({sl} ≥ {p})",
+    "BUY_LIMIT requires price < take_profit ({p} ≥ {tp})",
+    "SELL_LIMIT requires price > market_price ({p} ≤ {mp})",
+    "SELL_LIMIT requires take_profit < price ({tp} ≥ {p})",
+    "SELL_LIMIT requires price < stop_loss ({p} ≥ {sl})",
+    "BUY_STOP requires price > market_price ({p} ≤ {mp})",
+    "BUY_STOP requires stop_loss < price ({sl} ≥ {p})",
+    "BUY_STOP requires price < take_profit ({p} ≥ {tp})",
+    "SELL_STOP requires price < market_price ({p} ≥ {mp})",
+    "SELL_STOP requires price < stop_loss ({p} ≥ {sl})",
+    "SELL_STOP requires take_profit < price ({tp} ≥ {p})",
+    "BUY_STOP_LIMIT trigger price {p} must be above market {current}",
+    "BUY_STOP_LIMIT stop_loss {sl} must sit above market {current}",
+    "BUY_STOP_LIMIT requires stop_loss {ref} < take_profit {tp}",
+    "SELL_STOP_LIMIT trigger price {p} must be below market {current}",
+    "SELL_STOP_LIMIT stop_loss {sl} must sit below market {current}",
+    "SELL_STOP_LIMIT requires take_profit {tp} < stop_loss {ref}",
+)
+
+@njit(cache=True)
+def _pending_error_code(code: int, p: float, mp: float, current: float, sl: float, tp: float, has_sl: bool, has_tp: bool) -> int:
+    """Return 0 if the pending order levels are consistent, else the index of the failed rule in `_ERR_MSG_TEMPLATES`."""
+    if code == _BUY_LIMIT:
+        if not (p < mp):
+            return 1
+        if has_sl and not (sl < p):
+            return 2
+        if has_tp and not (p < tp):
+            return 3
+    elif code == _SELL_LIMIT:
+        if not (p > mp):
+            return 4
+        if has_tp and not (tp < p):
+            return 5
+        if has_sl and not (p < sl):
+            return 6
+    elif code == _BUY_STOP:
+        if not (p > mp):
+            return 7
+        if has_sl and not (sl < p):
+            return 8
+        if has_tp and not (p < tp):
+            return 9
+    elif code == _SELL_STOP:
+        if not (p < mp):
+            return 10
+        if has_sl and not (p < sl):
+            return 11
+        if has_tp and not (tp < p):
+            return 12
+    elif code == _BUY_STOP_LIMIT:
+        if not (current < p):
+            return 13
+        if has_sl and not (current < sl):
+            return 14
+        if has_tp and not ((sl < tp) if has_sl else (p < tp)):
+            return 15
+    elif code == _SELL_STOP_LIMIT:
+        if not (current > p):
+            return 16
+        if has_sl and not (sl < current):
+            return 17
+        if has_tp and not ((tp < sl) if has_sl else (tp < p)):
+            return 18
+    return 0
+
+def _pending_error(code: int, p: float, sl: Optional[float], tp: Optional[float], mp: float, current: float) -> Optional[str]:
+    """Validate a pending order's price/SL/TP against the market; return an error message or None."""
+    has_sl = sl is not None
+    has_tp = tp is not None
+    err = _pending_error_code(code, p, mp, current, sl if has_sl else 0.0, tp if has_tp else 0.0, has_sl, has_tp)
+    if not err:
+        return None
+    return _ERR_MSG_TEMPLATES[err].format(p=p, sl=sl, tp=tp, mp=mp, current=current, ref=sl if has_sl else p)
+
+@njit(cache=True, parallel=True)
+def _pending_error_codes(code, p, mp, current, sl, tp, has_sl, has_tp):
+    """Vectorized `_pending_error_code` over equal-length arrays (one row per order)."""
+    out = np.zeros(p.shape[0], dtype=np.int32)
+    for i in prange(p.shape[0]):
+        out[i] = _pending_error_code(code[i], p[i], mp[i], current[i], sl[i], tp[i], has_sl[i], has_tp[i])
+    return out
+
+def _pending_errors(
+    codes: Sequence[int],
+    p: Sequence[float],
+    sl: Sequence[Optional[float]],
+    tp: Sequence[Optional[float]],
+    mp: Sequence[float],
+    current: Sequence[float],
+) -> List[Optional[str]]:
+    """Batch form of `_pending_error`: one error message (or None) per order."""
+    has_sl = np.array([x is not None for x in sl], dtype=np.bool_)
+    has_tp = np.array([x is not None for x in tp], dtype=np.bool_)
+    errs = _pending_error_codes(
+        np.asarray(codes, dtype=np.int64),
+        np.asarray(p, dtype=np.float64),
+        np.asarray(mp, dtype=np.float64),
+        np.asarray(current, dtype=np.float64),
+        np.array([0.0 if x is None else x for x in sl], dtype=np.float64),
+        np.array([0.0 if x is None else x for x in tp], dtype=np.float64),
+        has_sl,
+        has_tp,
+    )
+    return [
+        None if not err else _ERR_MSG_TEMPLATES[err].format(
+            p=p[i], sl=sl[i], tp=tp[i], mp=mp[i], current=current[i], ref=sl[i] if has_sl[i] else p[i],
+        )
+        for i, err in enumerate(errs)
+    ]
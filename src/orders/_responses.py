@@ -0,0 +1,19 @@
+from typing import Dict, Any
+from utils.mt5_client import mt5
+from utils.logger import logger
+
+# Retcodes meaning the trade server accepted the request: filled, partially filled, or placed.
+_RETCODE_OK = frozenset({
+    mt5.TRADE_RETCODE_DONE,
+    mt5.TRADE_RETCODE_DONE_PARTIAL,
+    mt5.TRADE_RETCODE_PLACED,
+})
+
+def _err(msg: str) -> Dict[str, Any]:
+    """Log `msg` and wrap it in the standard error response."""
+    logger.error(msg)
+    return {"status": "error", "message": msg, "data": None}
+
+def _ok(msg: str, data: Any) -> Dict[str, Any]:
+    """Wrap `data` in the standard success response."""
+    return {"status": "success", "message": msg, "data": data}
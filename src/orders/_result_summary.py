@@ -0,0 +1,36 @@
+from typing import Dict, Any
+
+def _result_summary(result: Any, verbose: bool = False) -> Dict[str, Any]:
+    """
+    Internal helper to package an MT5 OrderSendResult for a tool response.
+
+    By default only the fields callers act on are returned, avoiding a full
+    `_asdict()` copy of the result and its nested request on every order.
+
+    Parameters:
+        result : OrderSendResult
+            Result returned by `mt5.order_send`.
+        verbose : bool, optional
+            If True, return every OrderSendResult field plus the echoed
+            'request' dict. Defaults to False.
+
+    Returns:
+        dict: A mapping with the following keys (all fields when verbose):
+            - retcode (int): Trade server return code
+            - order (int): Order ticket, if placed
+            - deal (int): Deal ticket, if executed
+            - volume (float): Volume confirmed by the broker
+            - price (float): Price confirmed by the broker
+    """
+    if verbose:
+        data = result._asdict()
+        data["request"] = result.request._asdict()
+        return data
+
+    return {
+        "retcode": result.retcode,
+        "order": result.order,
+        "deal": result.deal,
+        "volume": result.volume,
+        "price": result.price,
+    }
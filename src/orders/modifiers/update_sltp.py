@@ -2,25 +2,40 @@ from typing import Dict, Optional, Any
 from utils.mt5_client import mt5
 from utils.mcp_client import mcp
 from utils.logger import logger
+from orders._responses import _RETCODE_OK, _err, _ok
+from orders._result_summary import _result_summary
+
+_ACTION_SLTP = mt5.TRADE_ACTION_SLTP
+_TICKET_MIN = 100_000_000
+_TICKET_MAX = 999_999_999
+# position type -> (direction sign, required SL side, required TP side)
+_SLTP_RULES = {
+    mt5.POSITION_TYPE_BUY: (1, "less", "greater"),
+    mt5.POSITION_TYPE_SELL: (-1, "greater", "less"),
+}
 
 @mcp.tool()
 def update_sltp(
     position_ticket: int,
     stop_loss: Optional[float] = None,
     take_profit: Optional[float] = None,
+    verbose: bool = False,
 ) -> Dict[str, Any]:
     """
     Modify stop-loss and take-profit levels for an existing MT5 position.
 
     Updates SL and/or TP for a given position, preserving any level not specified.
+    Passing 0.0 for either level removes it, as MT5 treats a zero SL/TP as unset.
 
     Parameters:
         position_ticket : int
             Ticket number of the position to update.
         stop_loss : float, optional
-            New stop-loss level. If None, retains existing level.
+            New stop-loss level. If None, retains existing level; 0.0 removes it.
         take_profit : float, optional
-            New take-profit level. If None, retains existing level.
+            New take-profit level. If None, retains existing level; 0.0 removes it.
+        verbose : bool, optional
+            If True, return the full OrderSendResult including 'request'. Defaults to False.
 
     Returns:
         dict:
@@ -29,73 +44,50 @@ def update_sltp(
             - message (str):
                 Details of outcome or error description.
             - data (dict):
-                MT5 OrderSendResult fields as dict if successful; None on error.
+                MT5 OrderSendResult summary if successful (full result with 'request' when verbose); None on error.
     """
     logger.info(f"Initiating SLTP update for position={position_ticket}, stop_loss={stop_loss}, take_profit={take_profit}")
 
     if not position_ticket:
-        msg = "Position ticket required for SLTP"
-        logger.error(msg)
-        return {"status": "error", "message": msg, "data": None}
+        return _err("Position ticket required for SLTP")
     
-    if len(str(position_ticket)) != 9:
-        msg = "Position ticket must be a 9-digit number"
-        logger.error(msg)
-        return {"status": "error", "message": msg, "data": None}
-
-    if position_ticket <= 0 :
-        msg = "Position ticket must be a positive integer"
-        logger.error(msg)
-        return {"status": "error", "message": msg, "data": None}
+    if not (_TICKET_MIN <= position_ticket <= _TICKET_MAX):
+        return _err("Position ticket must be a 9-digit number")
 
     pos = mt5.positions_get(ticket=position_ticket)
     logger.info(f"Position: {pos}") 
 
     if not pos or len(pos) != 1:
-        msg = f"Failed to retrieve position with ticket {position_ticket}"
-        logger.error(msg)
-        return {"status": "error", "message": msg, "data": None}
+        return _err(f"Failed to retrieve position with ticket {position_ticket}")
     
     current = pos[0]
 
     req = {
-        "action": mt5.TRADE_ACTION_SLTP,
+        "action": _ACTION_SLTP,
         "position": position_ticket,
     }
 
-    sl = float(stop_loss) if stop_loss else None
-    tp = float(take_profit) if take_profit else None
+    sl = float(stop_loss) if stop_loss is not None else None
+    tp = float(take_profit) if take_profit is not None else None
 
-    if current.type == 1:
-        if current.price_current > sl:
-            msg = f"Update SLTP error: stop_loss {sl} must be greater than current price {current.price_current}"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-        if current.price_current < tp:
-            msg = f"Update SLTP error: take_profit {tp} must be less than current price {current.price_current}"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-    elif current.type == 0:
-        if current.price_current < sl:
-            msg = f"Update SLTP error: stop_loss {sl} must be less than current price {current.price_current}"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-        if current.price_current > tp:
-            msg = f"Update SLTP error: take_profit {tp} must be greater than current price {current.price_current}"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-                
-    req["sl"] = sl if sl else current.sl
-    req["tp"] = tp if tp else current.tp
+    rule = _SLTP_RULES.get(current.type)
+    if rule is not None:
+        sign, sl_side, tp_side = rule
+        price = current.price_current
+        # A zero level clears that side, so there is no price relation to check.
+        if sl and sign * (price - sl) < 0:
+            return _err(f"Update SLTP error: stop_loss {sl} must be {sl_side} than current price {price}")
+        if tp and sign * (tp - price) < 0:
+            return _err(f"Update SLTP error: take_profit {tp} must be {tp_side} than current price {price}")
+
+    req["sl"] = sl if sl is not None else current.sl
+    req["tp"] = tp if tp is not None else current.tp
 
     logger.info(f"SLTP request payload: {req}")
 
     result = mt5.order_send(req)
-
-    err, desc = mt5.last_error()
-    if err != 1:
-        msg = f"MT5 SLTP update failed {err}: {desc}"
-        logger.error(msg)
-        return {"status": "error", "message": msg, "data": None}
+    if result is None or result.retcode not in _RETCODE_OK:
+        err, desc = mt5.last_error() if result is None else (result.retcode, result.comment)
+        return _err(f"MT5 SLTP update failed {err}: {desc}")
     
-    return {"status": "success", "message": "Updated SLTP successfully!", "data": result._asdict()}
\ No newline at end of file
+    return _ok("Updated SLTP successfully!", _result_summary(result, verbose))
\ No newline at end of file
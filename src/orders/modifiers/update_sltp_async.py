@@ -0,0 +1,29 @@
+import asyncio
+from typing import Dict, Optional, Any
+from orders.modifiers.update_sltp import update_sltp
+
+async def update_sltp_async(
+    position_ticket: int,
+    stop_loss: Optional[float] = None,
+    take_profit: Optional[float] = None,
+    verbose: bool = False,
+) -> Dict[str, Any]:
+    """
+    Awaitable variant of `update_sltp`.
+
+    Runs the blocking MT5 calls in a worker thread so SL/TP updates on several
+    positions can proceed concurrently without stalling the event loop.
+
+    Parameters:
+        Same as `update_sltp`.
+
+    Returns:
+        dict: Same structure as `update_sltp`.
+    """
+    return await asyncio.to_thread(
+        update_sltp,
+        position_ticket=position_ticket,
+        stop_loss=stop_loss,
+        take_profit=take_profit,
+        verbose=verbose,
+    )
@@ -2,11 +2,16 @@ from typing import Dict, Any
 from utils.mt5_client import mt5
 from utils.mcp_client import mcp
 from utils.logger import logger
+from orders._responses import _RETCODE_OK, _err, _ok
+from orders._result_summary import _result_summary
+
+_ACTION_CLOSE_BY = mt5.TRADE_ACTION_CLOSE_BY
 
 @mcp.tool()
 def close_by(
     position_ticket: int,
     position_by: int,
+    verbose: bool = False,
 ) -> Dict[str, Any]:
     """
     Close an open MT5 position by offsetting it against another open position.
@@ -19,6 +24,8 @@ def close_by(
             Ticket of the position to be closed.
         position_by : int
             Ticket of the position against which to close the first.
+        verbose : bool, optional
+            If True, return the full OrderSendResult including 'request'. Defaults to False.
 
     Returns:
         dict:
@@ -27,39 +34,32 @@ def close_by(
             - message (str):
                 Description of outcome or error details.
             - data (dict):
-                MT5 OrderSendResult fields as dict if successful; None on error.
+                MT5 OrderSendResult summary if successful (full result with 'request' when verbose); None on error.
     """
     logger.info(f"Initiating close by: pos={position_ticket}, by={position_by}")
 
     if not position_ticket or not position_by or position_ticket <= 0 or position_by <= 0:
-        msg = "Both position and position_by tickets required and must be positive integers"
-        logger.error(msg)
-        return {"status": "error", "message": msg, "data": None}
+        return _err("Both position and position_by tickets required and must be positive integers")
 
-    position_get = mt5.positions_get(ticket=position_ticket)
+    positions_by_ticket = {p.ticket: p for p in mt5.positions_get() or ()}
+    position_get = positions_by_ticket.get(position_ticket)
     logger.info(f"Position: {position_get}")
-    position_by_get = mt5.positions_get(ticket=position_by)
+    position_by_get = positions_by_ticket.get(position_by)
     logger.info(f"Position by: {position_by_get}")
 
-    if not position_get or len(position_get) != 1:
-        msg = f"Failed to retrieve position with ticket {position_ticket}"
-        logger.error(msg)
-        return {"status": "error", "message": msg, "data": None}
+    if position_get is None:
+        return _err(f"Failed to retrieve position with ticket {position_ticket}")
     
-    if not position_by_get or len(position_by_get) != 1:
-        msg = f"Failed to retrieve position with ticket {position_by}"
-        logger.error(msg)
-        return {"status": "error", "message": msg, "data": None}
+    if position_by_get is None:
+        return _err(f"Failed to retrieve position with ticket {position_by}")
 
-    position_symbol = position_get[0].symbol
-    position_vol = position_get[0].volume
-    position_by_symbol = position_by_get[0].symbol
-    position_vol = position_get[0].volume
+    position_symbol = position_get.symbol
+    position_vol = position_get.volume
+    position_by_symbol = position_by_get.symbol
+    position_by_vol = position_by_get.volume
 
     if position_symbol != position_by_symbol:
-        msg = f"Position and position_by must be on the same symbol"
-        logger.error(msg)
-        return {"status": "error", "message": msg, "data": None}
+        return _err(f"Position and position_by must be on the same symbol")
 
     if position_by_vol > position_vol:
         logger.info(f"Swapping close_by roles because position_by.volume ({position_by_vol}) > position.volume ({position_vol})")
@@ -67,23 +67,16 @@ def close_by(
         position_vol, position_by_vol = position_by_vol, position_vol
 
     req = {
-        "action": mt5.TRADE_ACTION_CLOSE_BY,
+        "action": _ACTION_CLOSE_BY,
         "position": position_ticket,
         "position_by": position_by
     }
     
     logger.info(f"Close_by request: {req}")
     result = mt5.order_send(req)
-    err, desc = mt5.last_error()
-    logger.info(f"Error code: {err}, Error description: {desc}")
-    
-    if err != 1:
-        msg = f"MT5 close_by failed {err}: {desc}"
-        logger.error(msg)
-        return {"status": "error", "message": msg, "data": None}
+    if result is None or result.retcode not in _RETCODE_OK:
+        err, desc = mt5.last_error() if result is None else (result.retcode, result.comment)
+        return _err(f"MT5 close_by failed {err}: {desc}")
     
     logger.info(f"Close by executed successfully: {result}")
-    data = result._asdict()
-    data["request"] = result.request._asdict()
-    
-    return {"status": "success", "message": "Close by executed successfully!", "data": data}
\ No newline at end of file
+    return _ok("Close by executed successfully!", _result_summary(result, verbose))
\ No newline at end of file
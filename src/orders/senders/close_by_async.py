@@ -0,0 +1,27 @@
+import asyncio
+from typing import Dict, Any
+from orders.senders.close_by import close_by
+
+async def close_by_async(
+    position_ticket: int,
+    position_by: int,
+    verbose: bool = False,
+) -> Dict[str, Any]:
+    """
+    Awaitable variant of `close_by`.
+
+    Runs the blocking MT5 calls in a worker thread so several close-by requests
+    can be issued concurrently without stalling the event loop.
+
+    Parameters:
+        Same as `close_by`.
+
+    Returns:
+        dict: Same structure as `close_by`.
+    """
+    return await asyncio.to_thread(
+        close_by,
+        position_ticket=position_ticket,
+        position_by=position_by,
+        verbose=verbose,
+    )
@@ -1,9 +1,39 @@
+from functools import lru_cache
 from typing import Dict, Optional, Union, Any
 from utils.mt5_client import mt5
 from utils.mcp_client import mcp
 from utils.logger import logger
+from utils.symbol_cache import select_symbol, symbol_info
+from orders._responses import _RETCODE_OK, _err, _ok
+from orders._result_summary import _result_summary
 from utils.mappings.order_type_mapping import ORDER_TYPE_MAP
 
+_BUY = mt5.ORDER_TYPE_BUY
+_SELL = mt5.ORDER_TYPE_SELL
+_ACTION_DEAL = mt5.TRADE_ACTION_DEAL
+_DIRECTION = {_BUY: 1, _SELL: -1}
+_SLTP_ORDER_ERRORS = {
+    1: "For BUY orders: stop_loss < entry_price < take_profit required",
+    -1: "For SELL orders: take_profit < entry_price < stop_loss required",
+}
+_REQUEST_TEMPLATE = {
+    "action": _ACTION_DEAL,
+    "symbol": None,
+    "volume": None,
+    "type": None,
+    "price": None,
+    "deviation": None,
+    "magic": None,
+    "comment": None,
+}
+
+@lru_cache(maxsize=32)
+def _normalize_order_type(order_type: Union[str, int]) -> Optional[int]:
+    """Resolve an order type name (any case) or MT5 constant to its MT5 code."""
+    if isinstance(order_type, str):
+        return ORDER_TYPE_MAP.get(order_type.upper())
+    return order_type
+
 @mcp.tool()
 def send_market_order(
     symbol: str,
@@ -13,7 +43,8 @@ def send_market_order(
     take_profit: Optional[float] = None,
     deviation: int = 20,
     magic: int = 0,
-    comment: str = "via TradePilot"
+    comment: str = "via TradePilot",
+    verbose: bool = False,
 ) -> Dict[str, Any]:
     """
     Place a market (instant execution) order on MT5 for a specified symbol.
@@ -38,6 +69,8 @@ def send_market_order(
             Expert Advisor magic number. Defaults to 0.
         comment : str, Optional
             Order comment. Defaults to 'via TradePilot'.
+        verbose : bool, optional
+            If True, return the full OrderSendResult including 'request'. Defaults to False.
 
     Returns:
         dict:
@@ -46,86 +79,61 @@ def send_market_order(
             - message (str): 
                 Description of outcome or error details.
             - data (dict):  
-                MT5 OrderSendResult as dict including 'request' fields if successful; None on failure.
+                MT5 OrderSendResult summary if successful (full result with 'request' when verbose); None on failure.
     """
     logger.info(f"Initiating market order: symbol={symbol}, volume={volume}, type={order_type}")
 
-    if isinstance(order_type, str):
-        code = ORDER_TYPE_MAP.get(order_type.upper())
-        if code is None:
-            msg = f"Unknown market order_type '{order_type}'"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-    else:
-        code = order_type
+    code = _normalize_order_type(order_type)
+    if code is None:
+        return _err(f"Unknown market order_type '{order_type}'")
     logger.info(f"Normalized order type: {code}")
 
-    tick = mt5.symbol_info_tick(symbol)
-    if tick is None:
-        msg = f"Cannot retrieve market price for: {symbol}"
-        logger.error(msg)
-        return {"status": "error", "message": msg, "data": None}
+    if volume <= 0 or volume > 100:
+        return _err(f"Volume must be a number >0 and ≤100")
 
-    if stop_loss and take_profit:
+    sign = _DIRECTION.get(code)
+    if sign and stop_loss is not None and take_profit is not None:
         sl = float(stop_loss)
         tp = float(take_profit)
-        if code == mt5.ORDER_TYPE_BUY and not (sl < tick.ask < tp):
-            msg = "For BUY orders: stop_loss < entry_price < take_profit required"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-        if code == mt5.ORDER_TYPE_SELL and not (tp < tick.ask < sl):
-            msg = "For SELL orders: take_profit < entry_price < stop_loss required"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-
-    if not mt5.symbol_select(symbol, True):
-        msg = f"Cannot select symbol '{symbol}'"
-        logger.error(msg)
-        return {"status": "error", "message": msg, "data": None}
-    logger.info(f"Selected symbol: {symbol}")
+        if sign * (tp - sl) <= 0:
+            return _err(_SLTP_ORDER_ERRORS[sign])
 
-    if volume <= 0 or volume > 100:
-        msg = f"Volume must be a number >0 and ≤100"
-        logger.error(msg)
-        return {"status": "error", "message": msg, "data": None}
+    if not select_symbol(symbol):
+        return _err(f"Cannot select symbol '{symbol}'")
 
     tick = mt5.symbol_info_tick(symbol)
     if tick is None:
-        msg = f"No tick data available for '{symbol}'"
-        logger.error(msg)
-        return {"status": "error", "message": msg, "data": None}
+        return _err(f"Cannot retrieve market price for: {symbol}")
     logger.info(f"Tick data: {tick}")
 
-    entry_price = tick.ask if code == mt5.ORDER_TYPE_BUY else tick.bid
+    entry_price = tick.ask if code == _BUY else tick.bid
     logger.info(f"Entry price: {entry_price}")
 
-    req = {
-        "action": mt5.TRADE_ACTION_DEAL,
-        "symbol": symbol,
-        "volume": float(volume),
-        "type": code,
-        "price": entry_price,
-        "deviation": deviation,
-        "magic": magic,
-        "comment": comment,
-    }
-
-    if stop_loss:
-        req["sl"] = float(stop_loss)
-    if take_profit:
-        req["tp"] = float(take_profit)
+    if sign and stop_loss is not None and take_profit is not None:
+        if sign * (entry_price - sl) <= 0 or sign * (tp - entry_price) <= 0:
+            return _err(_SLTP_ORDER_ERRORS[sign])
+
+    req = _REQUEST_TEMPLATE.copy()
+    req["symbol"] = symbol
+    req["volume"] = float(volume)
+    req["type"] = code
+    req["price"] = entry_price
+    req["deviation"] = deviation
+    req["magic"] = magic
+    req["comment"] = comment
+
+    info = symbol_info(symbol)
+    digits = info.digits if info is not None else None
+    if stop_loss is not None:
+        req["sl"] = round(float(stop_loss), digits) if digits is not None else float(stop_loss)
+    if take_profit is not None:
+        req["tp"] = round(float(take_profit), digits) if digits is not None else float(take_profit)
     logger.debug(f"Market order request: {req}")
 
     result = mt5.order_send(req)
-    error_code, error_desc = mt5.last_error()
-    logger.info(f"Error code: {error_code}, Error description: {error_desc}")
-
-    if error_code != 1:
-        msg = f"MT5 market order failed {error_code}: {error_desc}"
-        logger.error(msg)
-        return {"status": "error", "message": msg, "data": None}
+    if result is None or result.retcode not in _RETCODE_OK:
+        error_code, error_desc = mt5.last_error() if result is None else (result.retcode, result.comment)
+        return _err(f"MT5 market order failed {error_code}: {error_desc}")
     
     logger.info(f"Market order placed successfully: {result}")
-    data = result._asdict()
-    data["request"] = result.request._asdict()
-    return {"status": "success", "message": "Market order placed successfully!", "data": data}
\ No newline at end of file
+    return _ok("Market order placed successfully!", _result_summary(result, verbose))
\ No newline at end of file
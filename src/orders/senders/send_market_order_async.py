@@ -0,0 +1,39 @@
+import asyncio
+from typing import Dict, Optional, Union, Any
+from orders.senders.send_market_order import send_market_order
+
+async def send_market_order_async(
+    symbol: str,
+    volume: float,
+    order_type: Union[str, int],
+    stop_loss: Optional[float] = None,
+    take_profit: Optional[float] = None,
+    deviation: int = 20,
+    magic: int = 0,
+    comment: str = "via TradePilot",
+    verbose: bool = False,
+) -> Dict[str, Any]:
+    """
+    Awaitable variant of `send_market_order`.
+
+    Runs the blocking MT5 calls in a worker thread so independent orders can be
+    submitted concurrently (e.g. with `asyncio.gather`) without stalling the event loop.
+
+    Parameters:
+        Same as `send_market_order`.
+
+    Returns:
+        dict: Same structure as `send_market_order`.
+    """
+    return await asyncio.to_thread(
+        send_market_order,
+        symbol=symbol,
+        volume=volume,
+        order_type=order_type,
+        stop_loss=stop_loss,
+        take_profit=take_profit,
+        deviation=deviation,
+        magic=magic,
+        comment=comment,
+        verbose=verbose,
+    )
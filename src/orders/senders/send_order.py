@@ -1,10 +1,473 @@
-from typing import Dict, Union, Any
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Literal, Optional, Tuple, Union, Any
 from utils.mappings.mapping_utils import to_code
 from utils.mt5_client import mt5
 from utils.mcp_client import mcp
 from utils.logger import logger
+from orders._responses import _RETCODE_OK, _err, _ok
 from utils.mappings.order_type_mapping import ORDER_TYPE_MAP
 from utils.mappings.order_filling_mapping import ORDER_FILLING_MAP
+from orders._pending_validators import _pending_error
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:  # orjson is optional; the stdlib fallback is slower and its output is not byte-identical
+    import json
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=str).encode()
+
+_ACTION_MAP = {name[len("TRADE_ACTION_"):]: getattr(mt5, name) for name in dir(mt5) if name.startswith("TRADE_ACTION_")}
+_TIME_MAP = {name[len("ORDER_TIME_"):]: getattr(mt5, name) for name in dir(mt5) if name.startswith("ORDER_TIME_")}
+
+_BUY = mt5.ORDER_TYPE_BUY
+_SELL = mt5.ORDER_TYPE_SELL
+_BUY_LIMIT = mt5.ORDER_TYPE_BUY_LIMIT
+_SELL_LIMIT = mt5.ORDER_TYPE_SELL_LIMIT
+_BUY_STOP = mt5.ORDER_TYPE_BUY_STOP
+_SELL_STOP = mt5.ORDER_TYPE_SELL_STOP
+_BUY_STOP_LIMIT = mt5.ORDER_TYPE_BUY_STOP_LIMIT
+_SELL_STOP_LIMIT = mt5.ORDER_TYPE_SELL_STOP_LIMIT
+_TIME_SPECIFIED = mt5.ORDER_TIME_SPECIFIED
+_TIME_GTC = mt5.ORDER_TIME_GTC
+_VALID_PENDING = frozenset({
+    _BUY_LIMIT, _SELL_LIMIT,
+    _BUY_STOP, _SELL_STOP,
+    _BUY_STOP_LIMIT, _SELL_STOP_LIMIT,
+})
+
+_REQUEST_KEYS = (
+    "action", "symbol", "volume", "price", "sl", "tp", "deviation", "magic",
+    "order", "position", "type", "type_filling", "type_time", "expiration", "comment",
+)
+
+@lru_cache(maxsize=32)
+def _order_type_code(order_type: str) -> Optional[int]:
+    """Memoized, case-insensitive ORDER_TYPE_MAP lookup."""
+    return ORDER_TYPE_MAP.get(order_type.upper())
+
+@lru_cache(maxsize=32)
+def _filling_code(type_filling: Union[int, str]) -> Optional[int]:
+    """Memoized `to_code` for filling modes, which come from a tiny fixed vocabulary."""
+    return to_code(type_filling, ORDER_FILLING_MAP)
+
+def _check_volume(volume: Any) -> Optional[str]:
+    """Return an error message unless `volume` is a number >0 and ≤100."""
+    if isinstance(volume, (int, float)) and 0 < volume <= 100:
+        return None
+    return "Volume must be a number >0 and ≤100"
+
+def _fetch_tick(symbol: str) -> Tuple[Any, Optional[str]]:
+    """Fetch the latest tick for `symbol`, returning (tick, None) or (None, error message)."""
+    tick = mt5.symbol_info_tick(symbol)
+    if tick is None:
+        return None, f"Cannot retrieve market price for: {symbol}"
+    return tick, None
+
+@dataclass
+class _OrderContext:
+    """Normalized `send_order` arguments shared by the per-action handlers."""
+    symbol: Optional[str]
+    volume: Optional[float]
+    ocode: Optional[int]
+    price: float
+    sl: Optional[float]
+    tp: Optional[float]
+    position: Optional[int]
+    position_by: Optional[int]
+    order: Optional[int]
+    expiration: Optional[str]
+    type_filling: Union[int, str, None]
+    type_time: Union[int, str, None]
+    selected_filling: Optional[int]
+    symbol_info: Any
+    tick: Any
+
+def _handle_deal(req: Dict[str, Any], ctx: _OrderContext) -> Optional[Dict[str, Any]]:
+    """Validate and complete `req` for TRADE_ACTION_DEAL; return an error response or None."""
+    symbol, volume, ocode = ctx.symbol, ctx.volume, ctx.ocode
+    sl, tp, selected_filling = ctx.sl, ctx.tp, ctx.selected_filling
+    tick = ctx.tick
+
+    logger.info("DEAL: Market Order Processing")
+
+    if symbol is None:
+        return _err("Symbol is required")
+
+    if volume is None:
+        return _err("Volume is required")
+
+    if ocode not in (_BUY, _SELL):
+        return _err(f"DEAL requires BUY or SELL, got: {ocode}")
+
+    if tick is None:
+        tick, msg = _fetch_tick(symbol)
+        if tick is None:
+            return _err(msg)
+    req["price"] = tick.ask if ocode == _BUY else tick.bid
+
+    if sl and tp:
+        if ocode == _BUY and not (sl < tick.ask < tp):
+            return _err("For BUY orders: stop_loss < entry_price < take_profit required")
+        if ocode == _SELL and not (tp < tick.ask < sl):
+            return _err("For SELL orders: take_profit < entry_price < stop_loss required")
+
+    req["sl"] = sl or 0.0
+    req["tp"] = tp or 0.0
+    if selected_filling is not None: req["type_filling"] = selected_filling
+
+    return None
+
+def _handle_sltp(req: Dict[str, Any], ctx: _OrderContext) -> Optional[Dict[str, Any]]:
+    """Validate and complete `req` for TRADE_ACTION_SLTP; return an error response or None."""
+    position, sl, tp = ctx.position, ctx.sl, ctx.tp
+
+    logger.info("SLTP: Modify SL/TP")
+
+    if position is None:
+        return _err("SLTP requires a position ticket")
+
+    if not (sl or tp):
+        return _err("SLTP requires stop_loss or take_profit")
+
+    pos = mt5.positions_get(ticket=position)
+    logger.info("Position: %s", pos)
+
+    if not pos or len(pos) != 1:
+        return _err(f"Failed to retrieve position with ticket {position}")
+
+    current = pos[0]
+
+    if current.type == 1:
+        if sl is not None and current.price_current > sl:
+            return _err(f"SLTP error: stop_loss {sl} must be greater than current price {current.price_current}")
+        if tp is not None and current.price_current < tp:
+            return _err(f"SLTP error: take_profit {tp} must be less than current price {current.price_current}")
+    elif current.type == 0:
+        if sl is not None and current.price_current < sl:
+            return _err(f"SLTP error: stop_loss {sl} must be less than current price {current.price_current}")
+        if tp is not None and current.price_current > tp:
+            return _err(f"SLTP error: take_profit {tp} must be greater than current price {current.price_current}")
+
+    new_sl = sl if sl else current.sl
+    new_tp = tp if tp else current.tp
+    if new_sl == current.sl and new_tp == current.tp:
+        return _err(f"SLTP unchanged for position {position}: stop_loss and take_profit already set")
+
+    req["position"] = position
+    req["sl"] = new_sl
+    req["tp"] = new_tp
+
+    return None
+
+def _handle_pending(req: Dict[str, Any], ctx: _OrderContext) -> Optional[Dict[str, Any]]:
+    """Validate and complete `req` for TRADE_ACTION_PENDING; return an error response or None."""
+    symbol, volume, ocode = ctx.symbol, ctx.volume, ctx.ocode
+    price, sl, tp = ctx.price, ctx.sl, ctx.tp
+    expiration, type_filling, type_time = ctx.expiration, ctx.type_filling, ctx.type_time
+    selected_filling, symbol_info, tick = ctx.selected_filling, ctx.symbol_info, ctx.tick
+
+    logger.info("PENDING: Pending Order Processing")
+
+    if symbol is None:
+        return _err("Symbol is required")
+
+    if volume is None:
+        return _err("Volume is required")
+
+    if ocode not in _VALID_PENDING:
+        return _err(f"Invalid PENDING order type: {ocode}")
+
+    if not price:
+        return _err("PENDING orders require a price")
+
+    req["price"] = price
+    if isinstance(type_filling, str) or isinstance(type_filling, int):
+        req["type_filling"] = selected_filling
+
+    if expiration:
+        req["type_time"] = (
+            type_time if isinstance(type_time, int)
+            else _TIME_MAP.get(type_time.upper(), _TIME_SPECIFIED)
+        )
+        req["expiration"] = expiration
+    else:
+        req["type_time"] = (
+            type_time if isinstance(type_time, int)
+            else _TIME_GTC
+        )
+
+    if tick is None and symbol_info is not None and not (sl or tp):
+        tick = symbol_info
+    elif tick is None:
+        tick, msg = _fetch_tick(symbol)
+        if tick is None:
+            return _err(msg)
+
+    current = tick.ask if ocode in (_BUY_STOP, _BUY_STOP_LIMIT) else tick.bid
+    mp = (tick.bid + tick.ask) / 2
+
+    err = _pending_error(ocode, price, sl, tp, mp, current)
+    if err:
+        return _err(err)
+
+    req["sl"] = sl or 0.0
+    req["tp"] = tp or 0.0
+
+    return None
+
+def _handle_modify(req: Dict[str, Any], ctx: _OrderContext) -> Optional[Dict[str, Any]]:
+    """Validate and complete `req` for TRADE_ACTION_MODIFY; return an error response or None."""
+    order, price, sl, tp = ctx.order, ctx.price, ctx.sl, ctx.tp
+
+    logger.info("MODIFY: Modify pending order")
+
+    if not order:
+        return _err("MODIFY requires an order ticket")
+    req["order"] = order
+
+    if price:       req["price"] = price
+    req["sl"] = sl or 0.0
+    req["tp"] = tp or 0.0
+
+    return None
+
+def _handle_remove(req: Dict[str, Any], ctx: _OrderContext) -> Optional[Dict[str, Any]]:
+    """Validate and complete `req` for TRADE_ACTION_REMOVE; return an error response or None."""
+    order = ctx.order
+
+    logger.info("REMOVE: Remove pending order")
+
+    if not order:
+        return _err("REMOVE requires an order ticket")
+
+    pending_orders = mt5.orders_get(ticket=order)
+    if not pending_orders:
+        return _err(f"No pending orders found with ticket {order}")
+
+    if len(pending_orders) != 1:
+        return _err(f"Expected 1 pending order, got {len(pending_orders)}")   
+
+    req["order"] = order
+
+    return None
+
+def _handle_close_by(req: Dict[str, Any], ctx: _OrderContext) -> Optional[Dict[str, Any]]:
+    """Validate and complete `req` for TRADE_ACTION_CLOSE_BY; return an error response or None."""
+    position, position_by = ctx.position, ctx.position_by
+
+    logger.info("CLOSE_BY: Close by")
+
+    position_get = mt5.positions_get(ticket=position)
+    logger.info("Position: %s", position_get)
+    position_by_get = mt5.positions_get(ticket=position_by)
+    logger.info("Position by: %s", position_by_get)
+
+    if not position_get or len(position_get) != 1:
+        return _err(f"Failed to retrieve position with ticket {position}")
+
+    if not position_by_get or len(position_by_get) != 1:
+        return _err(f"Failed to retrieve position with ticket {position_by}")
+
+    position_symbol = position_get[0].symbol
+    position_by_symbol = position_by_get[0].symbol
+    position_vol = position_get[0].volume
+    position_by_vol = position_by_get[0].volume
+
+    if position_by_vol > position_vol:
+        logger.info("Swapping close_by roles because position_by.volume (%s) > position.volume (%s)", position_by_vol, position_vol)
+        position, position_by = position_by, position
+        position_vol, position_by_vol = position_by_vol, position_vol
+
+    if position_symbol != position_by_symbol:
+        return _err(f"Position and position_by must be on the same symbol")
+
+    if not position or not position_by:
+        return _err("CLOSE_BY needs position & position_by")
+
+    req["position"]    = position
+    req["position_by"] = position_by
+
+    return None
+
+_HANDLERS = {
+    mt5.TRADE_ACTION_DEAL: _handle_deal,
+    mt5.TRADE_ACTION_SLTP: _handle_sltp,
+    mt5.TRADE_ACTION_PENDING: _handle_pending,
+    mt5.TRADE_ACTION_MODIFY: _handle_modify,
+    mt5.TRADE_ACTION_REMOVE: _handle_remove,
+    mt5.TRADE_ACTION_CLOSE_BY: _handle_close_by,
+}
+
+def _build_request(
+    action: Union[str, int] | None = None,
+    symbol: str | None = None,
+    volume: float | None = None,
+    order_type: Union[str, int] | None = None,
+    price: float | None = 0.0,
+    stop_loss: float | None = 0.0,
+    take_profit: float | None = 0.0,
+    position: int | None = 0,
+    position_by: int | None = 0,
+    order: int | None = 0,
+    expiration: str | None = None,
+    type_filling: Union[int, str] | None = None,
+    type_time: Union[int, str] | None = None,
+    deviation: int = 20,
+    magic: int = 0,
+    comment: str = "via TradePilot",
+    symbol_info: Any = None,
+    tick: Any = None,
+) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Validate `send_order` arguments and build the MT5 request payload.
+
+    `symbol_info` and `tick` may be supplied by callers that already fetched them
+    (e.g. batched submission) to skip the corresponding terminal round-trips.
+
+    Returns:
+        tuple: (request, None) when valid; (None, error response) otherwise.
+    """
+    logger.info("Initializing Order with: action=%s, symbol=%s, volume=%s, order_type=%s", action, symbol, volume, order_type)
+
+    if action is None:
+        return None, _err("Action is required")
+
+    act = action if isinstance(action, int) else (action or "").upper()
+    logger.info("Normalized action initial: %s", act)
+    if isinstance(act, str):
+        act = _ACTION_MAP.get(act)
+        if act is None:
+            return None, _err(f"Unknown action '{action}'")
+    logger.info("Resolved action constant: %s", act)
+
+    if isinstance(order_type, str):
+        ocode = _order_type_code(order_type)
+        if ocode is None:
+            return None, _err(f"Unknown order_type '{order_type}'")
+    else:
+        ocode = order_type
+    logger.info("Order type code: %s", ocode)
+
+    if symbol and symbol_info is None:
+        logger.info("Selecting symbol: %s", symbol)
+        if not mt5.symbol_select(symbol, True):
+            return None, _err(f"Cannot select symbol '{symbol}'")
+        symbol_info = mt5.symbol_info(symbol)
+
+        if symbol_info is None:
+            return None, _err(f"No symbol info for '{symbol}'")
+        logger.debug("Symbol info: %s", symbol_info)
+
+    selected_filling = None
+    if symbol and type_filling is not None:
+        selected_filling = _filling_code(type_filling)
+        if selected_filling is None:
+            return None, _err(f"Invalid type_filling '{type_filling}'")
+        logger.info("Selected filling mode: %s", selected_filling)
+
+    price = float(price)
+    if not isinstance(price, float):
+        return None, _err("Invalid price")
+    sl = float(stop_loss) if stop_loss else None
+    tp = float(take_profit) if take_profit else None
+
+    if volume is not None:
+        volume_err = _check_volume(volume)
+        if volume_err:
+            return None, _err(volume_err)
+        volume = float(volume)
+
+    # Every key the handlers may set is present up front so the dict is sized once;
+    # unset (None) entries are dropped before the request is returned.
+    req: Dict = {
+        "action": act,
+        "symbol": symbol or None,
+        "volume": volume,
+        "type": ocode,
+        "deviation": deviation,
+        "magic": magic,
+        "comment": comment or "via TradePilot",
+        "price": None,
+        "sl": None,
+        "tp": None,
+        "type_filling": None,
+        "type_time": None,
+        "expiration": None,
+        "order": None,
+        "position": None,
+        "position_by": None,
+    }
+    logger.debug("Base request built: %s", req)
+
+    handler = _HANDLERS.get(act)
+    if handler is None:
+        return None, _err(f"Unsupported action: {act}")
+
+    ctx = _OrderContext(
+        symbol=symbol,
+        volume=volume,
+        ocode=ocode,
+        price=price,
+        sl=sl,
+        tp=tp,
+        position=position,
+        position_by=position_by,
+        order=order,
+        expiration=expiration,
+        type_filling=type_filling,
+        type_time=type_time,
+        selected_filling=selected_filling,
+        symbol_info=symbol_info,
+        tick=tick,
+    )
+    error = handler(req, ctx)
+    if error is not None:
+        return None, error
+
+    req = {k: v for k, v in req.items() if v is not None}
+    logger.debug("Final request payload: %s", req)
+    return req, None
+
+def _send(req: Dict[str, Any], return_mode: str = "dict") -> Union[Dict[str, Any], bytes]:
+    """Submit a built request via `mt5.order_send` and package the outcome per `return_mode`."""
+    result = mt5.order_send(req)
+    if result is None or result.retcode not in _RETCODE_OK:
+        err, desc = mt5.last_error() if result is None else (result.retcode, result.comment)
+        error = _err(f"MT5 error {err}: {desc}")
+        return _dumps(error) if return_mode == "json" else error
+    
+    logger.info("Order sent successfully: %s", result)
+
+    if return_mode == "raw":
+        return _ok("Order sent successfully!", result)
+
+    mt5_res = result._asdict()
+
+    req_dict = result.request._asdict()
+    req_dict = {k: req_dict[k] for k in _REQUEST_KEYS}
+
+    mt5_res["request"] = req_dict
+
+    response = _ok("Order sent successfully!", mt5_res)
+    return _dumps(response) if return_mode == "json" else response
+
+def _submit_order(return_mode: Literal["dict", "raw", "json"] = "dict", **fields: Any) -> Union[Dict[str, Any], bytes]:
+    """
+    Build and send a `send_order` request for in-process callers.
+
+    `return_mode` is 'dict' for the tool response, 'raw' to put the MT5 OrderSendResult
+    itself in 'data', or 'json' for the dict response pre-serialized to JSON bytes. It is
+    not offered on the MCP tool: FastMCP re-encodes any result that is not a dict.
+    """
+    req, error = _build_request(**fields)
+    if error is not None:
+        return _dumps(error) if return_mode == "json" else error
+    return _send(req, return_mode)
 
 @mcp.tool()
 def send_order(
@@ -82,427 +545,24 @@ def send_order(
             - data (dict):
                 MT5 OrderSendResult fields and 'request' details if successful; None on error.
     """
-
-    logger.info(f"Initializing Order with: action={action}, symbol={symbol}, volume={volume}, order_type={order_type}")
-
-    if action is None:
-        msg = "Action is required"
-        logger.error(msg)
-        return {"status": "error", "message": msg, "data": None}
-
-    act = action if isinstance(action, int) else (action or "").upper()
-    logger.info(f"Normalized action initial: {act}")
-    if isinstance(act, str):
-        try:
-            act = getattr(mt5, f"TRADE_ACTION_{act}")
-        except Exception:
-            msg = f"Unknown action '{action}'"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-    logger.info(f"Resolved action constant: {act}")
-
-    if isinstance(order_type, str):
-        ocode = ORDER_TYPE_MAP.get(order_type.upper())
-        if ocode is None:
-            msg = f"Unknown order_type '{order_type}'"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-    else:
-        ocode = order_type
-    logger.info(f"Order type code: {ocode}")
-
-    symbol_info = None
-    if symbol:
-        logger.info(f"Selecting symbol: {symbol}")
-        if not mt5.symbol_select(symbol, True):
-            msg = f"Cannot select symbol '{symbol}'"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-        symbol_info = mt5.symbol_info(symbol)
-
-        if symbol_info is None:
-            msg = f"No symbol info for '{symbol}'"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-        logger.info(f"Symbol info: {symbol_info}")
-
-        selected_filling = to_code(type_filling, ORDER_FILLING_MAP) if type_filling is not None else None
-        logger.info(f"Selected filling mode: {selected_filling}")
-
-    price = float(price)
-    if not isinstance(price, float):
-        msg = "Invalid price"
-        logger.error(msg)
-        return {"status": "error", "message": msg, "data": None}
-
-    req: Dict = {"action": act}
-    if symbol:   req["symbol"] = symbol
-    if volume is not None:
-        if not isinstance(volume, (int, float)) or volume <= 0 or volume > 100:
-            logger.error(f"Invalid volume: {volume}")
-            return {"status": "error", "message": "Volume must be a number >0 and ≤100", "data": None}
-        req["volume"] = float(volume)
-
-    if ocode is not None:
-        req["type"] = ocode
-    req["deviation"] = deviation
-    req["magic"]     = magic
-    req["comment"]   = comment or "via TradePilot"
-    logger.info(f"Base request built: {req}")
-
-    match act:
-        case mt5.TRADE_ACTION_DEAL:
-            logger.info("DEAL: Market Order Processing")
-
-            if symbol is None:
-                msg = "Symbol is required"
-                logger.error(msg)
-                return {"status": "error", "message": msg, "data": None}
-        
-            if not volume:
-                msg = "Volume is required"
-                logger.error(msg)
-                return {"status": "error", "message": msg, "data": None}
-            
-            if volume <= 0 or volume > 100:
-                msg = "Volume must be a number >0 and ≤100"
-                logger.error(msg)
-                return {"status": "error", "message": msg, "data": None}
-            
-            if ocode not in (mt5.ORDER_TYPE_BUY, mt5.ORDER_TYPE_SELL):
-                msg = f"DEAL requires BUY or SELL, got: {ocode}"
-                logger.error(msg)
-                return {"status": "error", "message": msg, "data": None}
-            
-            tick = mt5.symbol_info_tick(symbol)
-            if tick is None:
-                msg = f"Cannot retrieve market price for: {symbol}"
-                logger.error(msg)
-                return {"status": "error", "message": msg, "data": None}
-            req["price"] = tick.ask if ocode == mt5.ORDER_TYPE_BUY else tick.bid
-
-            if stop_loss and take_profit:
-                sl = float(stop_loss)
-                tp = float(take_profit)
-                if ocode == mt5.ORDER_TYPE_BUY and not (sl < tick.ask < tp):
-                    msg = "For BUY orders: stop_loss < entry_price < take_profit required"
-                    logger.error(msg)
-                    return {"status": "error", "message": msg, "data": None}
-                if ocode == mt5.ORDER_TYPE_SELL and not (tp < tick.ask < sl):
-                    msg = "For SELL orders: take_profit < entry_price < stop_loss required"
-                    logger.error(msg)
-                    return {"status": "error", "message": msg, "data": None}
-
-            if stop_loss:   req["sl"] = float(stop_loss)
-            if take_profit: req["tp"] = float(take_profit)
-            if selected_filling: req["type_filling"] = selected_filling
-
-        case mt5.TRADE_ACTION_PENDING:
-            logger.info("PENDING: Pending Order Processing")
-
-            if symbol is None:
-                msg = "Symbol is required"
-                logger.error(msg)
-                return {"status": "error", "message": msg, "data": None}
-            
-            if not volume:
-                msg = "Volume is required"
-                logger.error(msg)
-                return {"status": "error", "message": msg, "data": None}
-            
-            if volume <= 0 or volume > 100:
-                msg = "Volume must be a number >0 and ≤100"
-                logger.error(msg)
-                return {"status": "error", "message": msg, "data": None}
-    
-            valid = (
-                mt5.ORDER_TYPE_BUY_LIMIT, mt5.ORDER_TYPE_SELL_LIMIT,
-                mt5.ORDER_TYPE_BUY_STOP, mt5.ORDER_TYPE_SELL_STOP,
-                mt5.ORDER_TYPE_BUY_STOP_LIMIT, mt5.ORDER_TYPE_SELL_STOP_LIMIT
-            )
-
-            if ocode not in valid:
-                msg = f"Invalid PENDING order type: {ocode}"
-                logger.error(msg)
-                return {"status": "error", "message": msg, "data": None}
-            
-            if not price:
-                msg = "PENDING orders require a price"
-                logger.error(msg)
-                return {"status": "error", "message": msg, "data": None}
-            
-            req["price"] = float(price)
-            if isinstance(type_filling, str) or isinstance(type_filling, int):
-                req["type_filling"] = selected_filling
-
-            if expiration:
-                req["type_time"] = (
-                    type_time if isinstance(type_time, int)
-                    else getattr(mt5, f"ORDER_TIME_{type_time.upper()}", mt5.ORDER_TIME_SPECIFIED)
-                )
-                req["expiration"] = expiration
-            else:
-                req["type_time"] = (
-                    type_time if isinstance(type_time, int)
-                    else mt5.ORDER_TIME_GTC
-                )
-            
-            tick = mt5.symbol_info_tick(symbol)
-            if tick is None:
-                msg = f"Cannot retrieve market price for: {symbol}"
-                logger.error(msg)
-                return {"status": "error", "message": msg, "data": None}
-            
-            p = float(price)
-            sl = float(stop_loss) if stop_loss else None
-            tp = float(take_profit) if take_profit else None
-            current = tick.ask if ocode in (mt5.ORDER_TYPE_BUY_STOP, mt5.ORDER_TYPE_BUY_STOP_LIMIT) else tick.bid
-            mp = (tick.bid + tick.ask) / 2
-
-            if ocode == mt5.ORDER_TYPE_BUY_LIMIT:
-                if not (p < mp):
-                    msg = f"BUY_LIMIT requires price < market_price ({p} ≥ {mp})"
-                    logger.error(msg)
-                    return {"status": "error", "message": msg, "data": None}
-                if sl is not None and not (sl < p):
-                    msg = f"BUY_LIMIT requires stop_loss < price ({sl} ≥ {p})"
-                    logger.error(msg)
-                    return {"status": "error", "message": msg, "data": None}
-                if tp is not None and not (p < tp):
-                    msg = f"BUY_LIMIT requires price < take_profit ({p} ≥ {tp})"
-                    logger.error(msg)
-                    return {"status": "error", "message": msg, "data": None}
-            elif ocode == mt5.ORDER_TYPE_SELL_LIMIT:
-                if not (p > mp):
-                    msg = f"SELL_LIMIT requires price > market_price ({p} ≤ {mp})"
-                    logger.error(msg)
-                    return {"status": "error", "message": msg, "data": None}
-                if tp is not None and not (tp < p):
-                    msg = f"SELL_LIMIT requires take_profit < price ({tp} ≥ {p})"
-                    logger.error(msg)
-                    return {"status": "error", "message": msg, "data": None}
-                if sl is not None and not (p < sl):
-                    msg = f"SELL_LIMIT requires price < stop_loss ({p} ≥ {sl})"
-                    logger.error(msg)
-                    return {"status": "error", "message": msg, "data": None}
-            elif ocode == mt5.ORDER_TYPE_BUY_STOP:
-                if not (p > mp):
-                    msg = f"BUY_STOP requires price > market_price ({p} ≤ {mp})"
-                    logger.error(msg)
-                    return {"status": "error", "message": msg, "data": None}
-                if sl is not None and not (sl < p):
-                    msg = f"BUY_STOP requires stop_loss < price ({sl} ≥ {p})"
-                    logger.error(msg)
-                    return {"status":"error","message":msg,"data":None}
-                if tp is not None and not (p < tp):
-                    msg = f"BUY_STOP requires price < take_profit ({p} ≥ {tp})"
-                    logger.error(msg)
-                    return {"status":"error","message":msg,"data":None}
-            elif ocode == mt5.ORDER_TYPE_SELL_STOP:
-                if not (p < mp):
-                    msg = f"SELL_STOP requires price < market_price ({p} ≥ {mp})"
-                    logger.error(msg)
-                    return {"status": "error", "message": msg, "data": None}
-                if sl is not None and not (p < sl):
-                    msg = f"SELL_STOP requires price < stop_loss ({p} ≥ {sl})"
-                    logger.error(msg)
-                    return {"status":"error","message":msg,"data":None}
-                if tp is not None and not (tp < p):
-                    msg = f"SELL_STOP requires take_profit < price ({tp} ≥ {p})"
-                    logger.error(msg)
-                    return {"status":"error","message":msg,"data":None}
-            elif ocode == mt5.ORDER_TYPE_BUY_STOP_LIMIT:
-                if not (current < p):
-                    msg = f"BUY_STOP_LIMIT trigger price {p} must be above market {current}"
-                    logger.error(msg)
-                    return {"status": "error", "message": msg, "data": None}
-                if sl is not None and not (current < sl):
-                    msg = f"BUY_STOP_LIMIT stop_loss {sl} must sit above market {current}"
-                    logger.error(msg)
-                    return {"status": "error", "message": msg, "data": None}
-                if tp is not None and not (sl < tp if sl is not None else p < tp):
-                    msg = f"BUY_STOP_LIMIT requires stop_loss {sl or p} < take_profit {tp}"
-                    logger.error(msg)
-                    return {"status": "error", "message": msg, "data": None}
-            elif ocode == mt5.ORDER_TYPE_SELL_STOP_LIMIT:
-                if not (current > p):
-                    msg = f"SELL_STOP_LIMIT trigger price {p} must be below market {current}"
-                    logger.error(msg)
-                    return {"status": "error", "message": msg, "data": None}
-                if sl is not None and not (sl < current):
-                    msg = f"SELL_STOP_LIMIT stop_loss {sl} must sit below market {current}"
-                    logger.error(msg)
-                    return {"status": "error", "message": msg, "data": None}
-                if tp is not None and not (tp < sl if sl is not None else tp < p):
-                    msg = f"SELL_STOP_LIMIT requires take_profit {tp} < stop_loss {sl or p}"
-                    logger.error(msg)
-                    return {"status": "error", "message": msg, "data": None}
-                
-            if stop_loss:   req["sl"] = float(stop_loss)
-            if take_profit: req["tp"] = float(take_profit)
-
-        case mt5.TRADE_ACTION_SLTP:
-            logger.info("SLTP: Modify SL/TP")
-
-            if position is None:
-                msg = "SLTP requires a position ticket"
-                logger.error(msg)
-                return {"status": "error", "message": msg, "data": None}
-
-            pos = mt5.positions_get(ticket=position)
-            logger.info(f"Position: {pos}")
-
-            if not pos or len(pos) != 1:
-                msg = f"Failed to retrieve position with ticket {position}"
-                logger.error(msg)
-                return {"status": "error", "message": msg, "data": None}
-
-            current = pos[0]
-
-            sl = float(stop_loss) if stop_loss else None
-            tp = float(take_profit) if take_profit else None
-
-            if current.type == 1:
-                if current.price_current > sl:
-                    msg = f"SLTP error: stop_loss {sl} must be greater than current price {current.price_current}"
-                    logger.error(msg)
-                    return {"status": "error", "message": msg, "data": None}
-                if current.price_current < tp:
-                    msg = f"SLTP error: take_profit {tp} must be less than current price {current.price_current}"
-                    logger.error(msg)
-                    return {"status": "error", "message": msg, "data": None}
-            elif current.type == 0:
-                if current.price_current < sl:
-                    msg = f"SLTP error: stop_loss {sl} must be less than current price {current.price_current}"
-                    logger.error(msg)
-                    return {"status": "error", "message": msg, "data": None}
-                if current.price_current > tp:
-                    msg = f"SLTP error: take_profit {tp} must be greater than current price {current.price_current}"
-                    logger.error(msg)
-                    return {"status": "error", "message": msg, "data": None}
-                
-            req["position"] = position
-            req["sl"] = sl if sl else current.sl
-            req["tp"] = tp if tp else current.tp
-
-        case mt5.TRADE_ACTION_MODIFY:
-            logger.info("MODIFY: Modify pending order")
-
-            if not order:
-                msg = "MODIFY requires an order ticket"
-                logger.error(msg)
-                return {"status": "error", "message": msg, "data": None}
-            req["order"] = order
-
-            if price:       req["price"] = float(price)
-            if stop_loss:   req["sl"]    = float(stop_loss)
-            if take_profit: req["tp"]    = float(take_profit)
-
-        case mt5.TRADE_ACTION_REMOVE:
-            logger.info("REMOVE: Remove pending order")
-
-            if not order:
-                msg = "REMOVE requires an order ticket"
-                logger.error(msg)
-                return {"status": "error", "message": msg, "data": None}
-            
-            pending_orders = mt5.orders_get(ticket=order)
-            if not pending_orders:
-                msg = f"No pending orders found with ticket {order}"
-                logger.error(msg)
-                return {"status": "error", "message": msg, "data": None}
-            
-            if len(pending_orders) != 1:
-                msg = f"Expected 1 pending order, got {len(pending_orders)}"
-                logger.error(msg)
-                return {"status": "error", "message": msg, "data": None}   
-            
-            req["order"] = order
-
-        case mt5.TRADE_ACTION_CLOSE_BY:
-            logger.info("CLOSE_BY: Close by")
-
-            position_get = mt5.positions_get(ticket=position)
-            logger.info(f"Position: {position_get}")
-            position_by_get = mt5.positions_get(ticket=position_by)
-            logger.info(f"Position by: {position_by_get}")
-
-            if not position_get or len(position_get) != 1:
-                msg = f"Failed to retrieve position with ticket {position}"
-                logger.error(msg)
-                return {"status": "error", "message": msg, "data": None}
-            
-            if not position_by_get or len(position_by_get) != 1:
-                msg = f"Failed to retrieve position with ticket {position_by}"
-                logger.error(msg)
-                return {"status": "error", "message": msg, "data": None}
-
-            position_symbol = position_get[0].symbol
-            position_by_symbol = position_by_get[0].symbol
-            position_vol = position_get[0].volume
-            position_by_vol = position_by_get[0].volume
-
-            if position_by_vol > position_vol:
-                logger.info(f"Swapping close_by roles because position_by.volume ({position_by_vol}) > position.volume ({position_vol})")
-                position, position_by = position_by, position
-                position_vol, position_by_vol = position_by_vol, position_vol
-
-            if position_symbol != position_by_symbol:
-                msg = f"Position and position_by must be on the same symbol"
-                logger.error(msg)
-                return {"status": "error", "message": msg, "data": None}
-
-            if not position or not position_by:
-                msg = "CLOSE_BY needs position & position_by"
-                logger.error(msg)
-                return {"status": "error", "message": msg, "data": None}
-            
-            req["position"]    = position
-            req["position_by"] = position_by
-
-        case _:
-            msg = f"Unsupported action: {act}"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-
-    logger.info(f"Final request payload: {req}")
-    result = mt5.order_send(req)
-    err, desc = mt5.last_error()
-    logger.info(f"Error code: {err}, Error description: {desc}")
-    
-    if err != 1:
-        msg = f"MT5 error {err}: {desc}"
-        logger.error(msg)
-        return {"status": "error", "message": msg, "data": None}
-    
-    logger.info(f"Order sent successfully: {result}")
-
-    mt5_res = result._asdict()
-
-    req_struct = result.request
-
-    req_dict = {
-        "action":         req_struct.action,
-        "symbol":         req_struct.symbol,
-        "volume":         req_struct.volume,
-        "price":          req_struct.price,
-        "sl":             req_struct.sl,
-        "tp":             req_struct.tp,
-        "deviation":      req_struct.deviation,
-        "magic":          req_struct.magic,
-        "order":          req_struct.order,
-        "position":       req_struct.position,
-        "type":           req_struct.type,
-        "type_filling":   req_struct.type_filling,
-        "type_time":      req_struct.type_time,
-        "expiration":     req_struct.expiration,
-        "comment":        req_struct.comment,
-    }
-
-    mt5_res["request"] = req_dict
-
-    return {
-        "status": "success",
-        "message": "Order sent successfully!",
-        "data": mt5_res
-    }
\ No newline at end of file
+    req, error = _build_request(
+        action=action,
+        symbol=symbol,
+        volume=volume,
+        order_type=order_type,
+        price=price,
+        stop_loss=stop_loss,
+        take_profit=take_profit,
+        position=position,
+        position_by=position_by,
+        order=order,
+        expiration=expiration,
+        type_filling=type_filling,
+        type_time=type_time,
+        deviation=deviation,
+        magic=magic,
+        comment=comment,
+    )
+    if error is not None:
+        return error
+    return _send(req)
\ No newline at end of file
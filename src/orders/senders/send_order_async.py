@@ -0,0 +1,67 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Literal, Union, Any
+from orders.senders.send_order import _submit_order
+
+_SENDER_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="send_order")
+
+async def send_order_async(
+    action: Union[str, int] | None = None,
+    symbol: str | None = None,
+    volume: float | None = None,
+    order_type: Union[str, int] | None = None,
+    price: float | None = 0.0,
+    stop_loss: float | None = 0.0,
+    take_profit: float | None = 0.0,
+    position: int | None = 0,
+    position_by: int | None = 0,
+    order: int | None = 0,
+    expiration: str | None = None,
+    type_filling: Union[int, str] | None = None,
+    type_time: Union[int, str] | None = None,
+    deviation: int = 20,
+    magic: int = 0,
+    comment: str = "via TradePilot",
+    return_mode: Literal["dict", "raw", "json"] = "dict",
+) -> Union[Dict[str, Any], bytes]:
+    """
+    Awaitable variant of `send_order`.
+
+    Submits the order on a small shared thread pool so the caller's event loop is
+    not blocked by the round-trip to the MT5 terminal, and a burst of orders can be
+    in flight at once (at most 4 concurrently).
+
+    Parameters:
+        Same as `send_order`, plus:
+        return_mode : str, optional
+            'dict' (default) for the `send_order` response, 'raw' to put the MT5
+            OrderSendResult itself in 'data', or 'json' for that response as JSON bytes.
+
+    Returns:
+        dict: Same structure as `send_order` (bytes when return_mode='json').
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _SENDER_POOL,
+        partial(
+            _submit_order,
+            action=action,
+            symbol=symbol,
+            volume=volume,
+            order_type=order_type,
+            price=price,
+            stop_loss=stop_loss,
+            take_profit=take_profit,
+            position=position,
+            position_by=position_by,
+            order=order,
+            expiration=expiration,
+            type_filling=type_filling,
+            type_time=type_time,
+            deviation=deviation,
+            magic=magic,
+            comment=comment,
+            return_mode=return_mode,
+        ),
+    )
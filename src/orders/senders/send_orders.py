@@ -0,0 +1,82 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any
+from utils.mt5_client import mt5
+from utils.mcp_client import mcp
+from utils.logger import logger
+from orders._responses import _err
+from orders.senders.send_order import _build_request, _send
+
+_MAX_WORKERS = 8
+
+@mcp.tool()
+def send_orders(orders: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Submit a batch of MT5 orders in one call.
+
+    Each entry accepts the same fields as `send_order`. Symbol selection, symbol info
+    and the latest tick are fetched once per distinct symbol and shared by every order
+    on it; validated requests are then sent concurrently.
+
+    Parameters:
+        orders : list of dict
+            Order specifications, each using `send_order` argument names
+            (e.g., {'action': 'DEAL', 'symbol': 'EURUSD', 'volume': 0.1, 'order_type': 'BUY'}).
+
+    Returns:
+        dict:
+            - status (str):
+                'success' if at least one order was sent; 'error' if the batch was
+                empty or every order failed.
+            - message (str):
+                Summary of how many orders were sent successfully.
+            - data (list):
+                One `send_order`-style response per input order, in input order.
+    """
+    logger.info(f"Sending batch of {len(orders)} orders")
+
+    if not orders:
+        return _err("At least one order is required")
+
+    symbol_ctx: Dict[str, Any] = {}
+    for symbol in {o.get("symbol") for o in orders if o.get("symbol")}:
+        if not mt5.symbol_select(symbol, True):
+            symbol_ctx[symbol] = f"Cannot select symbol '{symbol}'"
+            continue
+        symbol_info = mt5.symbol_info(symbol)
+        if symbol_info is None:
+            symbol_ctx[symbol] = f"No symbol info for '{symbol}'"
+            continue
+        symbol_ctx[symbol] = (symbol_info, mt5.symbol_info_tick(symbol))
+
+    results: List[Dict[str, Any]] = [None] * len(orders)
+    to_send = []
+    for i, order in enumerate(orders):
+        ctx = symbol_ctx.get(order.get("symbol"), (None, None))
+        if isinstance(ctx, str):
+            results[i] = _err(ctx)
+            continue
+
+        symbol_info, tick = ctx
+        try:
+            req, error = _build_request(**order, symbol_info=symbol_info, tick=tick)
+        except TypeError as e:
+            results[i] = _err(f"Invalid order fields: {e}")
+            continue
+        except ValueError as e:
+            results[i] = _err(f"Invalid order values: {e}")
+            continue
+
+        if error is not None:
+            results[i] = error
+        else:
+            to_send.append((i, req))
+
+    if to_send:
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(to_send))) as pool:
+            for (i, _), result in zip(to_send, pool.map(_send, [req for _, req in to_send])):
+                results[i] = result
+
+    sent = sum(1 for r in results if r["status"] == "success")
+    logger.info(f"Batch complete: {sent}/{len(orders)} orders sent")
+
+    return {"status": "success" if sent else "error", "message": f"Sent {sent} of {len(orders)} orders", "data": results}
@@ -1,9 +1,71 @@
-from typing import Dict, Optional, Union, Any
+from typing import Dict, Optional, Tuple, Union, Any
 from utils.mappings.mapping_utils import to_code
 from utils.mappings.order_type_mapping import ORDER_TYPE_MAP
+from utils.mappings.order_filling_mapping import ORDER_FILLING_MAP
 from utils.mt5_client import mt5
 from utils.mcp_client import mcp
 from utils.logger import logger
+from utils.symbol_cache import select_symbol
+from orders._responses import _RETCODE_OK, _err, _ok
+from orders._pending_validators import _pending_error
+
+_VALID_PENDING = frozenset({
+    mt5.ORDER_TYPE_BUY_LIMIT, mt5.ORDER_TYPE_SELL_LIMIT,
+    mt5.ORDER_TYPE_BUY_STOP, mt5.ORDER_TYPE_SELL_STOP,
+    mt5.ORDER_TYPE_BUY_STOP_LIMIT, mt5.ORDER_TYPE_SELL_STOP_LIMIT,
+})
+# Pending types whose reference price is the ask; all others use the bid.
+_BUY_STOP_CODES = frozenset({mt5.ORDER_TYPE_BUY_STOP, mt5.ORDER_TYPE_BUY_STOP_LIMIT})
+_ORDER_TIME = {name: getattr(mt5, f"ORDER_TIME_{name}") for name in ("GTC", "DAY", "SPECIFIED", "SPECIFIED_DAY")}
+
+def _as_float(x: Any) -> float:
+    """Return `x` as a float, skipping the conversion when it already is one."""
+    return x if type(x) is float else float(x)
+
+def _pending_request(
+    symbol: str,
+    volume: float,
+    code: int,
+    price: float,
+    expiration: Optional[str],
+    type_filling: Optional[Union[str, int]],
+    type_time: Optional[Union[str, int]],
+    deviation: int,
+    magic: int,
+    comment: str,
+) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Build the TRADE_ACTION_PENDING request body, without SL/TP.
+
+    Returns:
+        tuple: (request, None) when valid; (None, error response) otherwise.
+    """
+    req = {
+        "action": mt5.TRADE_ACTION_PENDING,
+        "symbol": symbol,
+        "volume": _as_float(volume),
+        "type": code,
+        "price": _as_float(price),
+        "deviation": deviation,
+        "magic": magic,
+        "comment": comment,
+    }
+
+    if expiration:
+        req["type_time"] = (type_time if isinstance(type_time, int)
+                            else _ORDER_TIME.get(type_time.upper(), _ORDER_TIME["SPECIFIED"]))
+        req["expiration"] = expiration
+    else:
+        req["type_time"] = (type_time if isinstance(type_time, int)
+                              else _ORDER_TIME["GTC"])
+
+    if type_filling:
+        filling = to_code(type_filling, ORDER_FILLING_MAP)
+        if filling is None:
+            return None, _err(f"Invalid type_filling '{type_filling}'")
+        req["type_filling"] = filling
+
+    return req, None
 
 @mcp.tool()
 def send_pending_order(
@@ -42,7 +104,7 @@ def send_pending_order(
         take_profit : float, optional
             Take-profit level.
         type_filling : str or int, optional
-            Filling mode name or constant (e.g., 'FOK', mt5.ORDER_FILLING_IOC).
+            Filling mode name or constant (e.g., 'FOK', 'BOC', mt5.ORDER_FILLING_IOC).
         type_time : str or int, optional
             Time mode name or constant (e.g., 'GTC', 'DAY', mt5.ORDER_TIME_SPECIFIED).
         deviation : int, optional
@@ -65,165 +127,54 @@ def send_pending_order(
 
     code = to_code(order_type, ORDER_TYPE_MAP)
     if code is None:
-        msg = f"Invalid pending order_type '{order_type}'"
-        logger.error(msg)
-        return {"status": "error", "message": msg, "data": None}
+        return _err(f"Invalid pending order_type '{order_type}'")
     logger.info(f"Resolved pending order type: {code}")
 
-    valid = (
-        mt5.ORDER_TYPE_BUY_LIMIT, mt5.ORDER_TYPE_SELL_LIMIT,
-        mt5.ORDER_TYPE_BUY_STOP, mt5.ORDER_TYPE_SELL_STOP,
-        mt5.ORDER_TYPE_BUY_STOP_LIMIT, mt5.ORDER_TYPE_SELL_STOP_LIMIT
-    )
-
-    if code not in valid:
-        msg = f"Invalid pending order type: {code}"
-        logger.error(msg)
-        return {"status": "error", "message": msg, "data": None}
+    if code not in _VALID_PENDING:
+        return _err(f"Invalid pending order type: {code}")
     logger.info(f"Normalized order type: {code}")
     
-    if not mt5.symbol_select(symbol, True):
-        msg = f"Cannot select symbol '{symbol}'"
-        logger.error(msg)
-        return {"status": "error", "message": msg, "data": None}
-    logger.info(f"Selected symbol: {symbol}")
+    if not select_symbol(symbol):
+        return _err(f"Cannot select symbol '{symbol}'")
 
     if not price:
-        msg = f"Price is required for pending order"
-        logger.error(msg)
-        return {"status": "error", "message": msg, "data": None}
+        return _err("Price is required for pending order")
 
-    req = {
-        "action": mt5.TRADE_ACTION_PENDING,
-        "symbol": symbol,
-        "volume": float(volume),
-        "type": code,
-        "price": float(price),
-        "deviation": deviation,
-        "magic": magic,
-        "comment": comment,
-    }
+    p = _as_float(price)
+    sl = _as_float(stop_loss) if stop_loss else None
+    tp = _as_float(take_profit) if take_profit else None
+
+    req, error = _pending_request(symbol, volume, code, p, expiration, type_filling, type_time, deviation, magic, comment)
+    if error is not None:
+        return error
 
-    if expiration:
-        req["type_time"] = (type_time if isinstance(type_time, int)
-                            else getattr(mt5, f"ORDER_TIME_{type_time.upper()}", mt5.ORDER_TIME_SPECIFIED))
-        req["expiration"] = expiration
-    else:
-        req["type_time"] = (type_time if isinstance(type_time, int)
-                              else mt5.ORDER_TIME_GTC)
-        
-    if type_filling:
-        req["type_filling"] = (type_filling if isinstance(type_filling, int)
-                                 else getattr(mt5, f"ORDER_FILLING_{type_filling.upper()}", None))
-    
     tick = mt5.symbol_info_tick(symbol)
     if tick is None:
-        msg = f"Cannot get tick for symbol '{symbol}'"
-        logger.error(msg)
-        return {"status": "error", "message": msg, "data": None}
-
-    p = float(price)
-    sl = float(stop_loss) if stop_loss else None
-    tp = float(take_profit) if take_profit else None
-    current = tick.ask if code in (mt5.ORDER_TYPE_BUY_STOP, mt5.ORDER_TYPE_BUY_STOP_LIMIT) else tick.bid
-    mp = (tick.bid + tick.ask) / 2
-
-    if code == mt5.ORDER_TYPE_BUY_LIMIT:
-        if not (p < mp):
-            msg = f"BUY_LIMIT requires price < market_price ({p} ≥ {mp})"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-        if sl is not None and not (sl < p):
-            msg = f"BUY_LIMIT requires stop_loss < price ({sl} ≥ {p})"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-        if tp is not None and not (p < tp):
-            msg = f"BUY_LIMIT requires price < take_profit ({p} ≥ {tp})"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-    elif code == mt5.ORDER_TYPE_SELL_LIMIT:
-        if not (p > mp):
-            msg = f"SELL_LIMIT requires price > market_price ({p} ≤ {mp})"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-        if tp is not None and not (tp < p):
-            msg = f"SELL_LIMIT requires take_profit < price ({tp} ≥ {p})"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-        if sl is not None and not (p < sl):
-            msg = f"SELL_LIMIT requires price < stop_loss ({p} ≥ {sl})"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-    elif code == mt5.ORDER_TYPE_BUY_STOP:
-        if not (p > mp):
-            msg = f"BUY_STOP requires price > market_price ({p} ≤ {mp})"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-        if sl is not None and not (sl < p):
-            msg = f"BUY_STOP requires stop_loss < price ({sl} ≥ {p})"
-            logger.error(msg)
-            return {"status":"error","message":msg,"data":None}
-        if tp is not None and not (p < tp):
-            msg = f"BUY_STOP requires price < take_profit ({p} ≥ {tp})"
-            logger.error(msg)
-            return {"status":"error","message":msg,"data":None}
-    elif code == mt5.ORDER_TYPE_SELL_STOP:
-        if not (p < mp):
-            msg = f"SELL_STOP requires price < market_price ({p} ≥ {mp})"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-        if sl is not None and not (p < sl):
-            msg = f"SELL_STOP requires price < stop_loss ({p} ≥ {sl})"
-            logger.error(msg)
-            return {"status":"error","message":msg,"data":None}
-        if tp is not None and not (tp < p):
-            msg = f"SELL_STOP requires take_profit < price ({tp} ≥ {p})"
-            logger.error(msg)
-            return {"status":"error","message":msg,"data":None}
-    elif code == mt5.ORDER_TYPE_BUY_STOP_LIMIT:
-        if not (current < p):
-            msg = f"BUY_STOP_LIMIT trigger price {p} must be above market {current}"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-        if sl is not None and not (current < sl):
-            msg = f"BUY_STOP_LIMIT stop_loss {sl} must sit above market {current}"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-        if tp is not None and not (sl < tp if sl is not None else p < tp):
-            msg = f"BUY_STOP_LIMIT requires stop_loss {sl or p} < take_profit {tp}"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-    elif code == mt5.ORDER_TYPE_SELL_STOP_LIMIT:
-        if not (current > p):
-            msg = f"SELL_STOP_LIMIT trigger price {p} must be below market {current}"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-        if sl is not None and not (sl < current):
-            msg = f"SELL_STOP_LIMIT stop_loss {sl} must sit below market {current}"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-        if tp is not None and not (tp < sl if sl is not None else tp < p):
-            msg = f"SELL_STOP_LIMIT requires take_profit {tp} < stop_loss {sl or p}"
-            logger.error(msg)
-            return {"status": "error", "message": msg, "data": None}
-
-    if stop_loss:
-        req["sl"] = float(stop_loss)
-    if take_profit:
-        req["tp"] = float(take_profit)
+        return _err(f"Cannot get tick for symbol '{symbol}'")
+
+    ask = tick.ask
+    bid = tick.bid
+    mp = (ask + bid) * 0.5
+    current = ask if code in _BUY_STOP_CODES else bid
+
+    msg = _pending_error(code, p, sl, tp, mp, current)
+    if msg:
+        return _err(msg)
+
+    if sl is not None:
+        req["sl"] = sl
+    if tp is not None:
+        req["tp"] = tp
 
     logger.info(f"Pending order request: {req}")
 
     result = mt5.order_send(req)
-    err, desc = mt5.last_error()
-    logger.info(f"Error code: {err}, Error description: {desc}")
-    if err != 1:
-        msg = f"MT5 pending order failed {err}: {desc}"
-        logger.error(msg)
-        return {"status": "error", "message": msg, "data": None}
+    if result is None or result.retcode not in _RETCODE_OK:
+        err, desc = mt5.last_error() if result is None else (result.retcode, result.comment)
+        return _err(f"MT5 pending order failed {err}: {desc}")
 
     logger.info(f"Pending order sent successfully: {result}")
     data = result._asdict()
     data["request"] = result.request._asdict()
     
-    return {"status": "success", "message": "Order sent successfully!", "data": data}
\ No newline at end of file
+    return _ok("Order sent successfully!", data)
\ No newline at end of file
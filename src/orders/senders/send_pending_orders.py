@@ -0,0 +1,138 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any
+from utils.mappings.mapping_utils import to_code
+from utils.mappings.order_type_mapping import ORDER_TYPE_MAP
+from utils.mt5_client import mt5
+from utils.mcp_client import mcp
+from utils.logger import logger
+from orders._pending_validators import _pending_errors
+from orders._responses import _err
+from orders.senders.send_order import _check_volume, _send
+from orders.senders.send_pending_order import _as_float, _pending_request, _VALID_PENDING, _BUY_STOP_CODES
+
+_MAX_WORKERS = 8
+
+_PENDING_DEFAULTS = {
+    "expiration": None,
+    "stop_loss": None,
+    "take_profit": None,
+    "type_filling": None,
+    "type_time": None,
+    "deviation": 20,
+    "magic": 0,
+    "comment": "via TradePilot",
+}
+
+@mcp.tool()
+def send_pending_orders(orders: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Place a batch of MT5 pending orders in one call.
+
+    Each entry accepts the same fields as `send_pending_order`. Every distinct symbol is
+    selected and its tick fetched once; price/SL/TP rules are checked for all orders in
+    one vectorized pass, and the valid orders are then sent concurrently.
+
+    Parameters:
+        orders : list of dict
+            Pending order specifications, each using `send_pending_order` argument names
+            (e.g., {'symbol': 'EURUSD', 'volume': 0.1, 'order_type': 'BUY_LIMIT', 'price': 1.08}).
+
+    Returns:
+        dict:
+            - status (str):
+                'success' if at least one order was placed; 'error' if the batch was
+                empty or every order failed.
+            - message (str):
+                Summary of how many orders were placed successfully.
+            - data (list):
+                One `send_pending_order`-style response per input order, in input order.
+    """
+    logger.info(f"Sending batch of {len(orders)} pending orders")
+
+    if not orders:
+        return _err("At least one order is required")
+
+    results: List[Dict[str, Any]] = [None] * len(orders)
+    rows = []
+    for i, order in enumerate(orders):
+        unknown = order.keys() - _PENDING_DEFAULTS.keys() - {"symbol", "volume", "order_type", "price"}
+        if unknown:
+            results[i] = _err(f"Invalid order fields: {sorted(unknown)}")
+            continue
+        spec = {**_PENDING_DEFAULTS, **order}
+
+        code = to_code(spec.get("order_type"), ORDER_TYPE_MAP)
+        if code not in _VALID_PENDING:
+            results[i] = _err(f"Invalid pending order_type '{spec.get('order_type')}'")
+            continue
+        if not spec.get("symbol") or spec.get("volume") is None:
+            results[i] = _err("symbol and volume are required for pending orders")
+            continue
+        if not spec.get("price"):
+            results[i] = _err("Price is required for pending order")
+            continue
+        try:
+            spec["volume"] = _as_float(spec["volume"])
+            spec["price"] = _as_float(spec["price"])
+            spec["stop_loss"] = _as_float(spec["stop_loss"]) if spec["stop_loss"] else None
+            spec["take_profit"] = _as_float(spec["take_profit"]) if spec["take_profit"] else None
+        except (TypeError, ValueError) as e:
+            results[i] = _err(f"Invalid order values: {e}")
+            continue
+        volume_error = _check_volume(spec["volume"])
+        if volume_error:
+            results[i] = _err(volume_error)
+            continue
+        rows.append((i, code, spec))
+
+    ticks: Dict[str, Any] = {}
+    for symbol in {spec["symbol"] for _, _, spec in rows}:
+        if not mt5.symbol_select(symbol, True):
+            ticks[symbol] = f"Cannot select symbol '{symbol}'"
+            continue
+        tick = mt5.symbol_info_tick(symbol)
+        ticks[symbol] = tick if tick is not None else f"Cannot get tick for symbol '{symbol}'"
+
+    checked = []
+    for i, code, spec in rows:
+        tick = ticks[spec["symbol"]]
+        if isinstance(tick, str):
+            results[i] = _err(tick)
+        else:
+            checked.append((i, code, spec, tick))
+
+    codes = [code for _, code, _, _ in checked]
+    p = [spec["price"] for _, _, spec, _ in checked]
+    sl = [spec["stop_loss"] for _, _, spec, _ in checked]
+    tp = [spec["take_profit"] for _, _, spec, _ in checked]
+    mp = [(tick.ask + tick.bid) * 0.5 for _, _, _, tick in checked]
+    current = [tick.ask if code in _BUY_STOP_CODES else tick.bid for _, code, _, tick in checked]
+
+    to_send = []
+    errors = _pending_errors(codes, p, sl, tp, mp, current) if checked else []
+    for n, ((i, code, spec, _), msg) in enumerate(zip(checked, errors)):
+        if msg:
+            results[i] = _err(msg)
+            continue
+        req, error = _pending_request(
+            spec["symbol"], spec["volume"], code, spec["price"], spec["expiration"],
+            spec["type_filling"], spec["type_time"], spec["deviation"], spec["magic"], spec["comment"],
+        )
+        if error is not None:
+            results[i] = error
+            continue
+        if sl[n] is not None:
+            req["sl"] = sl[n]
+        if tp[n] is not None:
+            req["tp"] = tp[n]
+        to_send.append((i, req))
+
+    if to_send:
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(to_send))) as pool:
+            for (i, _), result in zip(to_send, pool.map(_send, [req for _, req in to_send])):
+                results[i] = result
+
+    sent = sum(1 for r in results if r["status"] == "success")
+    logger.info(f"Pending batch complete: {sent}/{len(orders)} orders placed")
+
+    return {"status": "success" if sent else "error", "message": f"Placed {sent} of {len(orders)} orders", "data": results}
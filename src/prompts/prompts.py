@@ -1,6 +1,8 @@
 from utils.mcp_client import mcp
 from mcp.server.fastmcp.prompts.base import UserMessage, AssistantMessage
 
+_NO_CHANGE = "no change"
+
 @mcp.prompt()
 def connect_to_mt5(account: int, password: str, server: str) -> list:
     """Prompt for connecting and logging in to MT5."""
@@ -29,22 +31,26 @@ def analyze_tradingview_chart_and_trade(symbol: str) -> list:
         UserMessage("Proceed with the analysis and trade execution. If volume is not specified, prompt the user for it. If the user does not specify the volume, use the default volume of 0.1 lots. Execute the trade first and then show me the trade details."),
     ]
 
+_FETCH_ACCOUNT_SUMMARY = [
+    UserMessage("Show me my account summary including balance, equity, margin, free margin and all the stats"),
+    AssistantMessage("I'll retrieve your account's balance, equity, margin, free margin, margin level, and all the stats."),
+    UserMessage("Display all key account metrics in a clear format. I want to see all the stats in a table format. If possible show them as a Dashboard created with react.js"),
+]
+
 @mcp.prompt()
 def fetch_account_summary() -> list:
     """Prompt for fetching account summary."""
-    return [
-        UserMessage("Show me my account summary including balance, equity, margin, free margin and all the stats"),
-        AssistantMessage("I'll retrieve your account's balance, equity, margin, free margin, margin level, and all the stats."),
-        UserMessage("Display all key account metrics in a clear format. I want to see all the stats in a table format. If possible show them as a Dashboard created with react.js"),
-    ]
+    return list(_FETCH_ACCOUNT_SUMMARY)
+
+_FETCH_LEVERAGE_AND_MARGIN = [
+    UserMessage("What is my account leverage and current margin usage?"),
+    AssistantMessage("I'll fetch your account's leverage, used margin, and margin level."),
+]
 
 @mcp.prompt()
 def fetch_leverage_and_margin() -> list:
     """Prompt for fetching leverage and margin info."""
-    return [
-        UserMessage("What is my account leverage and current margin usage?"),
-        AssistantMessage("I'll fetch your account's leverage, used margin, and margin level."),
-    ]
+    return list(_FETCH_LEVERAGE_AND_MARGIN)
 
 @mcp.prompt()
 def analyze_market_data(symbol: str, timeframe: str) -> list:
@@ -60,7 +66,7 @@ def place_market_order(symbol: str, order_type: str, volume: float, sl: float =
     """Prompt for placing a market order with optional SL/TP."""
     return [
         UserMessage(f"I want to place a {order_type} market order for {symbol} with {volume} lots."),
-        AssistantMessage(f"I'll help you place a {order_type} market order for {symbol} with {volume} lots." + (f" I will also set a stop-loss at {sl}." if sl else "") + (f" and a take-profit at {tp}." if tp else "")),
+        AssistantMessage(f"I'll help you place a {order_type} market order for {symbol} with {volume} lots.{f' I will also set a stop-loss at {sl}.' if sl else ''}{f' and a take-profit at {tp}.' if tp else ''}"),
         AssistantMessage("First, I'll check your account's free margin and the current price for the symbol."),
         AssistantMessage("Then, I'll send the market order with the specified parameters. After execution, I'll confirm the order result and show you the details."),
         UserMessage("Please proceed with the order."),
@@ -71,7 +77,7 @@ def place_pending_order(symbol: str, order_type: str, price: float, volume: floa
     """Prompt for placing a pending order of any type."""
     return [
         UserMessage(f"Set a {order_type} pending order for {symbol} at {price} with {volume} lots."),
-        AssistantMessage(f"I'll create a {order_type} pending order for {symbol} at {price} with {volume} lots." + (f" SL: {sl}." if sl else "") + (f" TP: {tp}." if tp else "")),
+        AssistantMessage(f"I'll create a {order_type} pending order for {symbol} at {price} with {volume} lots.{f' SL: {sl}.' if sl else ''}{f' TP: {tp}.' if tp else ''}"),
         AssistantMessage("I'll check your margin, validate the order parameters, and place the pending order."),
         UserMessage("Proceed with the pending order setup."),
     ]
@@ -81,7 +87,7 @@ def modify_position_sltp(ticket: int, stop_loss: float = None, take_profit: floa
     """Prompt for modifying SL/TP of an open position."""
     return [
         UserMessage(f"Update stop-loss and take-profit for position {ticket}."),
-        AssistantMessage(f"I'll update the stop-loss to {stop_loss if stop_loss else 'no change'} and take-profit to {take_profit if take_profit else 'no change'} for position {ticket}."),
+        AssistantMessage(f"I'll update the stop-loss to {stop_loss or _NO_CHANGE} and take-profit to {take_profit or _NO_CHANGE} for position {ticket}."),
         AssistantMessage("I'll send the modification request and confirm the update."),
     ]
 
@@ -90,7 +96,7 @@ def modify_pending_order(ticket: int, price: float = None, stop_loss: float = No
     """Prompt for modifying a pending order's price, SL, or TP."""
     return [
         UserMessage(f"Modify pending order {ticket}."),
-        AssistantMessage(f"I'll update the order's price to {price if price else 'no change'}, stop-loss to {stop_loss if stop_loss else 'no change'}, and take-profit to {take_profit if take_profit else 'no change'}."),
+        AssistantMessage(f"I'll update the order's price to {price or _NO_CHANGE}, stop-loss to {stop_loss or _NO_CHANGE}, and take-profit to {take_profit or _NO_CHANGE}."),
         AssistantMessage("I'll send the modification request and confirm the update."),
     ]
 
@@ -118,21 +124,25 @@ def close_all_positions_by_symbol(symbol: str) -> list:
         AssistantMessage(f"I'll close all open positions for {symbol} and confirm the result."),
     ]
 
+_CLOSE_ALL_PROFITABLE_POSITIONS = [
+    UserMessage("Close all positions that are currently in profit."),
+    AssistantMessage("I'll identify all profitable positions and close them."),
+]
+
 @mcp.prompt()
 def close_all_profitable_positions() -> list:
     """Prompt for closing all profitable positions."""
-    return [
-        UserMessage("Close all positions that are currently in profit."),
-        AssistantMessage("I'll identify all profitable positions and close them."),
-    ]
+    return list(_CLOSE_ALL_PROFITABLE_POSITIONS)
+
+_CLOSE_ALL_LOSING_POSITIONS = [
+    UserMessage("Close all positions that are currently in loss."),
+    AssistantMessage("I'll identify all losing positions and close them."),
+]
 
 @mcp.prompt()
 def close_all_losing_positions() -> list:
     """Prompt for closing all losing positions."""
-    return [
-        UserMessage("Close all positions that are currently in loss."),
-        AssistantMessage("I'll identify all losing positions and close them."),
-    ]
+    return list(_CLOSE_ALL_LOSING_POSITIONS)
 
 @mcp.prompt()
 def fetch_open_positions(symbol: str = None) -> list:
@@ -215,19 +225,23 @@ def check_market_status(symbol: str) -> list:
         AssistantMessage(f"I'll check the trading session status for {symbol} and let you know if it's open or closed."),
     ]
 
+_FETCH_SERVER_INFO = [
+    UserMessage("Show me information about the connected server and broker."),
+    AssistantMessage("I'll fetch and display details about the trading server, broker, and connection status."),
+]
+
 @mcp.prompt()
 def fetch_server_info() -> list:
     """Prompt for fetching server and broker info."""
-    return [
-        UserMessage("Show me information about the connected server and broker."),
-        AssistantMessage("I'll fetch and display details about the trading server, broker, and connection status."),
-    ] 
+    return list(_FETCH_SERVER_INFO)
+
+_DISCONNECT_MT5 = [
+    UserMessage("Please disconnect me from MetaTrader 5."),
+    AssistantMessage("I'll shut down the MT5 terminal and ensure all connections are closed safely."),
+    UserMessage("Thank you. Confirm when disconnected."),
+]
 
 @mcp.prompt()
 def disconnect_mt5() -> list:
     """Prompt for disconnecting from MT5."""
-    return [
-        UserMessage("Please disconnect me from MetaTrader 5."),
-        AssistantMessage("I'll shut down the MT5 terminal and ensure all connections are closed safely."),
-        UserMessage("Thank you. Confirm when disconnected."),
-    ]
\ No newline at end of file
+    return list(_DISCONNECT_MT5)
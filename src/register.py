@@ -5,16 +5,69 @@ import sys
 base_path = os.path.abspath(os.path.dirname(__file__))
 sys.path.insert(0, base_path)
 
-def import_files(folder):
+from utils.logger import logger
+
+MANIFEST_MODULE = "_modules_manifest"
+
+def discover_modules(folder):
+    modules = []
+    sep = os.sep
     for root, dirs, files in os.walk(folder):
         dirs[:] = [d for d in dirs if not d.startswith("__")]
         for file in files:
             if file.endswith(".py") and not file.startswith("__"):
                 rel_path = os.path.relpath(os.path.join(root, file), base_path)
-                module_path = rel_path.replace(os.path.sep, ".").replace(".py", "")
-                try:
-                    importlib.import_module(module_path)
-                except Exception as e:
-                    print(f"Failed to import {module_path}: {e}")
+                module_path = rel_path[:-3].replace(sep, ".")
+                if module_path != MANIFEST_MODULE:
+                    modules.append(module_path)
+    return modules
+
+def load_manifest():
+    # Written at packaging time by `python register.py`; when present, boot trusts it and
+    # skips the filesystem walk. `python register.py --check` fails the build if it is stale.
+    try:
+        return importlib.import_module(MANIFEST_MODULE).MODULES
+    except ImportError:
+        return None
+
+def write_manifest(folder):
+    modules = sorted(discover_modules(folder))
+    with open(os.path.join(folder, f"{MANIFEST_MODULE}.py"), "w", encoding="utf-8") as f:
+        f.write("MODULES = [\n")
+        f.writelines(f"    {m!r},\n" for m in modules)
+        f.write("]\n")
+    return modules
+
+def stale_manifest(folder):
+    """Return the modules missing from and gone from the manifest, or None when it matches the tree."""
+    manifest = load_manifest()
+    if manifest is None:
+        return None
+    discovered = discover_modules(folder)
+    missing = sorted(set(discovered) - set(manifest))
+    gone = sorted(set(manifest) - set(discovered))
+    return (missing, gone) if missing or gone else None
+
+def import_files(folder):
+    modules = load_manifest()
+    if modules is None:
+        modules = discover_modules(folder)
+        logger.info("Registering %d modules found on disk", len(modules))
+    else:
+        logger.info("Registering %d modules from %s.py", len(modules), MANIFEST_MODULE)
+    for module_path in modules:
+        try:
+            importlib.import_module(module_path)
+        except Exception as e:
+            logger.warning("Failed to import %s: %s", module_path, e)
 
-import_files(base_path)
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--check"]:
+        stale = stale_manifest(base_path)
+        if stale:
+            sys.exit(f"{MANIFEST_MODULE}.py is stale (missing: {stale[0]}; gone: {stale[1]}); run `python register.py`")
+        print(f"{MANIFEST_MODULE}.py is up to date")
+    else:
+        print(f"Wrote {len(write_manifest(base_path))} modules to {MANIFEST_MODULE}.py")
+else:
+    import_files(base_path)
@@ -1,11 +1,13 @@
+import textwrap
+from functools import cache
+from mcp.server.fastmcp.resources import TextResource
 from utils.mcp_client import mcp
 
-@mcp.resource("mt5://getting_started")
-def getting_started() -> str:
-    """
-    Resource providing getting started information for the MetaTrader 5 API.
-    """
-    return """
+def _prep(body: str) -> str:
+    """Dedent and trim a resource body once, at import."""
+    return textwrap.dedent(body).strip()
+
+_GETTING_STARTED = _prep("""
     # Getting Started with MetaTrader 5 API
 
     This MCP server provides access to the MetaTrader 5 API for trading and market data analysis.
@@ -21,14 +23,9 @@ def getting_started() -> str:
     7. **Shut down the connection**
 
     See the other resources for detailed guides on each step.
-    """
+    """)
 
-@mcp.resource("mt5://full_trading_workflow")
-def full_trading_workflow() -> str:
-    """
-    Resource providing a full trading workflow from login to shutdown.
-    """
-    return """
+_FULL_TRADING_WORKFLOW = _prep("""
     # Full Trading Workflow Example
 
     ```python
@@ -56,14 +53,9 @@ def full_trading_workflow() -> str:
     # 8. Shutdown
     shutdown()
     ```
-    """
-    
-@mcp.resource("mt5://tradingview_chart_trade_guide")
-def tradingview_chart_trade_guide() -> str:
-    """
-    Guide for using screenshot-based trade analysis and execution.
-    """
-    return """
+    """)
+
+_TRADINGVIEW_CHART_TRADE_GUIDE = _prep("""
     # Screenshot Trade Analysis & Execution Guide
 
     You can upload a TradingView chart screenshot with green and red lines marking your Take Profit (TP) and Stop Loss (SL) levels.
@@ -86,14 +78,9 @@ def tradingview_chart_trade_guide() -> str:
     2. The system will analyze the image, extract TP, SL, and entry.
     3. It will determine the order type and direction.
     4. The trade will be placed automatically.
-    """
+    """)
 
-@mcp.resource("mt5://order_types_reference")
-def order_types_reference() -> str:
-    """
-    Resource providing a reference for all order types and trade actions.
-    """
-    return """
+_ORDER_TYPES_REFERENCE = _prep("""
     # Order Types and Trade Actions Reference
 
     ## Market Orders
@@ -115,14 +102,9 @@ def order_types_reference() -> str:
     - `TRADE_ACTION_MODIFY`: Modify an order
     - `TRADE_ACTION_REMOVE`: Remove a pending order
     - `TRADE_ACTION_CLOSE_BY`: Close a position by an opposite one
-    """
+    """)
 
-@mcp.resource("mt5://market_data_guide")
-def market_data_guide() -> str:
-    """
-    Resource providing a guide for accessing market data with the MetaTrader 5 API.
-    """
-    return """
+_MARKET_DATA_GUIDE = _prep("""
     # Market Data Guide
 
     ## Timeframes
@@ -137,14 +119,9 @@ def market_data_guide() -> str:
     ```python
     ticks = copy_ticks_from_pos(symbol="EURUSD", start_pos=0, count=10)
     ```
-    """
+    """)
 
-@mcp.resource("mt5://risk_management_guide")
-def risk_management_guide() -> str:
-    """
-    Resource providing a comprehensive guide to risk management in MT5.
-    """
-    return """
+_RISK_MANAGEMENT_GUIDE = _prep("""
     # Risk Management Guide
 
     ## Lot Size Calculation
@@ -158,14 +135,9 @@ def risk_management_guide() -> str:
 
     ## Risk/Reward Ratio
     Aim for at least 1:2 risk/reward.
-    """
+    """)
 
-@mcp.resource("mt5://account_info_reference")
-def account_info_reference() -> str:
-    """
-    Resource providing a reference for all account info fields.
-    """
-    return """
+_ACCOUNT_INFO_REFERENCE = _prep("""
     # Account Info Reference
 
     - `balance`: Account balance
@@ -175,66 +147,54 @@ def account_info_reference() -> str:
     - `margin_level`: Equity / margin * 100
     - `leverage`: Account leverage
     - `currency`: Deposit currency
-    """
+    """)
 
-@mcp.resource("mt5://example_market_order")
-def example_market_order() -> str:
-    """
-    Resource providing an example of placing a market order.
-    """
-    return """
-    # Example: Placing a Market Order
+_ORDER_REQUEST_TEMPLATE = _prep("""
+    # Example: {title}
 
     ```python
     request = OrderRequest(
-        action=mt5.TRADE_ACTION_DEAL,
-        symbol="EURUSD",
-        volume=0.1,
-        type=mt5.ORDER_TYPE_BUY,
-        price=mt5.symbol_info_tick("EURUSD").ask,
+        action=mt5.TRADE_ACTION_{action},
+    {fields}
         deviation=20,
         magic=123456,
-        comment="Buy order",
+        comment="{comment}",
         type_time=mt5.ORDER_TIME_GTC,
         type_filling=mt5.ORDER_FILLING_IOC
     )
     result = order_send(request)
     ```
-    """
-
-@mcp.resource("mt5://example_pending_order")
-def example_pending_order() -> str:
-    """
-    Resource providing an example of placing a pending order.
-    """
-    return """
-    # Example: Placing a Pending Order
-
-    ```python
-    request = OrderRequest(
-        action=mt5.TRADE_ACTION_PENDING,
-        symbol="EURUSD",
-        volume=0.1,
-        type=mt5.ORDER_TYPE_BUY_LIMIT,
-        price=1.08,
-        sl=1.07,
-        tp=1.09,
-        deviation=20,
-        magic=123456,
-        comment="Buy limit order",
-        type_time=mt5.ORDER_TIME_GTC,
-        type_filling=mt5.ORDER_FILLING_IOC
+    """)
+
+@cache
+def _render_example(title: str, action: str, comment: str, *fields: str) -> str:
+    """Render `_ORDER_REQUEST_TEMPLATE` for one order example; `fields` are the request-specific keyword lines."""
+    return _ORDER_REQUEST_TEMPLATE.format(
+        title=title,
+        action=action,
+        comment=comment,
+        fields="\n".join(f"    {f}," for f in fields),
     )
-    result = order_send(request)
-    ```
-    """
 
-@mcp.resource("mt5://example_modify_sltp")
-def example_modify_sltp() -> str:
-    """
-    Resource providing an example of modifying SL/TP for a position.
-    """
-    return """
+_EXAMPLE_MARKET_ORDER = _render_example(
+    "Placing a Market Order", "DEAL", "Buy order",
+    'symbol="EURUSD"',
+    "volume=0.1",
+    "type=mt5.ORDER_TYPE_BUY",
+    'price=mt5.symbol_info_tick("EURUSD").ask',
+)
+
+_EXAMPLE_PENDING_ORDER = _render_example(
+    "Placing a Pending Order", "PENDING", "Buy limit order",
+    'symbol="EURUSD"',
+    "volume=0.1",
+    "type=mt5.ORDER_TYPE_BUY_LIMIT",
+    "price=1.08",
+    "sl=1.07",
+    "tp=1.09",
+)
+
+_EXAMPLE_MODIFY_SLTP = _prep("""
     # Example: Modifying SL/TP
 
     ```python
@@ -247,54 +207,27 @@ def example_modify_sltp() -> str:
     )
     result = order_send(request)
     ```
-    """
-
-@mcp.resource("mt5://example_close_position")
-def example_close_position() -> str:
-    """
-    Resource providing an example of closing a position.
-    """
-    return """
-    # Example: Closing a Position
-
-    ```python
-    request = OrderRequest(
-        action=mt5.TRADE_ACTION_DEAL,
-        symbol=position.symbol,
-        volume=position.volume,
-        type=mt5.ORDER_TYPE_SELL if position.type == mt5.ORDER_TYPE_BUY else mt5.ORDER_TYPE_BUY,
-        price=mt5.symbol_info_tick(position.symbol).bid if position.type == mt5.ORDER_TYPE_BUY else mt5.symbol_info_tick(position.symbol).ask,
-        position=position.ticket,
-        deviation=20,
-        magic=123456,
-        comment="Close position",
-        type_time=mt5.ORDER_TIME_GTC,
-        type_filling=mt5.ORDER_FILLING_IOC
-    )
-    result = order_send(request)
-    ```
-    """
-
-@mcp.resource("mt5://example_account_summary")
-def example_account_summary() -> str:
-    """
-    Resource providing an example of fetching account summary.
-    """
-    return """
+    """)
+
+_EXAMPLE_CLOSE_POSITION = _render_example(
+    "Closing a Position", "DEAL", "Close position",
+    "symbol=position.symbol",
+    "volume=position.volume",
+    "type=mt5.ORDER_TYPE_SELL if position.type == mt5.ORDER_TYPE_BUY else mt5.ORDER_TYPE_BUY",
+    "price=mt5.symbol_info_tick(position.symbol).bid if position.type == mt5.ORDER_TYPE_BUY else mt5.symbol_info_tick(position.symbol).ask",
+    "position=position.ticket",
+)
+
+_EXAMPLE_ACCOUNT_SUMMARY = _prep("""
     # Example: Fetching Account Summary
 
     ```python
     summary = get_account_summary()
     print(summary)
     ```
-    """
+    """)
 
-@mcp.resource("mt5://example_fetch_positions")
-def example_fetch_positions() -> str:
-    """
-    Resource providing an example of fetching open positions.
-    """
-    return """
+_EXAMPLE_FETCH_POSITIONS = _prep("""
     # Example: Fetching Open Positions
 
     ```python
@@ -302,14 +235,9 @@ def example_fetch_positions() -> str:
     for pos in positions:
         print(pos)
     ```
-    """
+    """)
 
-@mcp.resource("mt5://example_trading_history")
-def example_trading_history() -> str:
-    """
-    Resource providing an example of fetching trading history.
-    """
-    return """
+_EXAMPLE_TRADING_HISTORY = _prep("""
     # Example: Fetching Trading History
 
     ```python
@@ -317,84 +245,54 @@ def example_trading_history() -> str:
     for order in orders:
         print(order)
     ```
-    """
+    """)
 
-@mcp.resource("mt5://example_calculate_lot_size")
-def example_calculate_lot_size() -> str:
-    """
-    Resource providing an example of calculating lot size.
-    """
-    return """
+_EXAMPLE_CALCULATE_LOT_SIZE = _prep("""
     # Example: Calculating Lot Size
 
     ```python
     result = calculate_lot_size(symbol="EURUSD", account_equity=10000, risk_pct=2, stop_loss_pips=50)
     print(result)
     ```
-    """
+    """)
 
-@mcp.resource("mt5://example_calculate_margin")
-def example_calculate_margin() -> str:
-    """
-    Resource providing an example of calculating margin required for a trade.
-    """
-    return """
+_EXAMPLE_CALCULATE_MARGIN = _prep("""
     # Example: Calculating Margin
 
     ```python
     result = calculate_margin(order_type="BUY", symbol="EURUSD", volume=0.1, price=1.1)
     print(result)
     ```
-    """
+    """)
 
-@mcp.resource("mt5://example_calculate_profit")
-def example_calculate_profit() -> str:
-    """
-    Resource providing an example of calculating profit/loss for a trade.
-    """
-    return """
+_EXAMPLE_CALCULATE_PROFIT = _prep("""
     # Example: Calculating Profit/Loss
 
     ```python
     result = calculate_profit(order_type="BUY", symbol="EURUSD", volume=0.1, price_open=1.1, price_close=1.12)
     print(result)
     ```
-    """
+    """)
 
-@mcp.resource("mt5://example_symbol_info")
-def example_symbol_info() -> str:
-    """
-    Resource providing an example of fetching symbol info.
-    """
-    return """
+_EXAMPLE_SYMBOL_INFO = _prep("""
     # Example: Fetching Symbol Info
 
     ```python
     info = get_symbol_info("EURUSD")
     print(info)
     ```
-    """
+    """)
 
-@mcp.resource("mt5://example_market_data")
-def example_market_data() -> str:
-    """
-    Resource providing an example of fetching market data.
-    """
-    return """
+_EXAMPLE_MARKET_DATA = _prep("""
     # Example: Fetching Market Data
 
     ```python
     rates = copy_rates_from_pos(symbol="EURUSD", timeframe=15, start_pos=0, count=10)
     print(rates)
     ```
-    """
+    """)
 
-@mcp.resource("mt5://example_portfolio_management")
-def example_portfolio_management() -> str:
-    """
-    Resource providing an example of multi-symbol portfolio management.
-    """
-    return """
+_EXAMPLE_PORTFOLIO_MANAGEMENT = _prep("""
     # Example: Portfolio Management
 
     ```python
@@ -404,4 +302,47 @@ def example_portfolio_management() -> str:
         for pos in pos_list:
             print(pos)
     ```
-    """
\ No newline at end of file
+    """)
+
+# (uri, name, description, body) for every static documentation resource.
+_RESOURCES = [
+    ("mt5://getting_started", "getting_started", "Resource providing getting started information for the MetaTrader 5 API.", _GETTING_STARTED),
+    ("mt5://full_trading_workflow", "full_trading_workflow", "Resource providing a full trading workflow from login to shutdown.", _FULL_TRADING_WORKFLOW),
+    ("mt5://tradingview_chart_trade_guide", "tradingview_chart_trade_guide", "Guide for using screenshot-based trade analysis and execution.", _TRADINGVIEW_CHART_TRADE_GUIDE),
+    ("mt5://order_types_reference", "order_types_reference", "Resource providing a reference for all order types and trade actions.", _ORDER_TYPES_REFERENCE),
+    ("mt5://market_data_guide", "market_data_guide", "Resource providing a guide for accessing market data with the MetaTrader 5 API.", _MARKET_DATA_GUIDE),
+    ("mt5://risk_management_guide", "risk_management_guide", "Resource providing a comprehensive guide to risk management in MT5.", _RISK_MANAGEMENT_GUIDE),
+    ("mt5://account_info_reference", "account_info_reference", "Resource providing a reference for all account info fields.", _ACCOUNT_INFO_REFERENCE),
+    ("mt5://example_market_order", "example_market_order", "Resource providing an example of placing a market order.", _EXAMPLE_MARKET_ORDER),
+    ("mt5://example_pending_order", "example_pending_order", "Resource providing an example of placing a pending order.", _EXAMPLE_PENDING_ORDER),
+    ("mt5://example_modify_sltp", "example_modify_sltp", "Resource providing an example of modifying SL/TP for a position.", _EXAMPLE_MODIFY_SLTP),
+    ("mt5://example_close_position", "example_close_position", "Resource providing an example of closing a position.", _EXAMPLE_CLOSE_POSITION),
+    ("mt5://example_account_summary", "example_account_summary", "Resource providing an example of fetching account summary.", _EXAMPLE_ACCOUNT_SUMMARY),
+    ("mt5://example_fetch_positions", "example_fetch_positions", "Resource providing an example of fetching open positions.", _EXAMPLE_FETCH_POSITIONS),
+    ("mt5://example_trading_history", "example_trading_history", "Resource providing an example of fetching trading history.", _EXAMPLE_TRADING_HISTORY),
+    ("mt5://example_calculate_lot_size", "example_calculate_lot_size", "Resource providing an example of calculating lot size.", _EXAMPLE_CALCULATE_LOT_SIZE),
+    ("mt5://example_calculate_margin", "example_calculate_margin", "Resource providing an example of calculating margin required for a trade.", _EXAMPLE_CALCULATE_MARGIN),
+    ("mt5://example_calculate_profit", "example_calculate_profit", "Resource providing an example of calculating profit/loss for a trade.", _EXAMPLE_CALCULATE_PROFIT),
+    ("mt5://example_symbol_info", "example_symbol_info", "Resource providing an example of fetching symbol info.", _EXAMPLE_SYMBOL_INFO),
+    ("mt5://example_market_data", "example_market_data", "Resource providing an example of fetching market data.", _EXAMPLE_MARKET_DATA),
+    ("mt5://example_portfolio_management", "example_portfolio_management", "Resource providing an example of multi-symbol portfolio management.", _EXAMPLE_PORTFOLIO_MANAGEMENT),
+]
+
+def _bulk_register(server, entries) -> None:
+    """
+    Register static (uri, name, description, body) resources on `server`.
+
+    Each body is stored on a TextResource, whose read() returns the prebuilt text
+    directly, instead of going through the `@server.resource` decorator (signature
+    inspection at import, a handler call on every read); all of these are static.
+    """
+    for uri, name, description, body in entries:
+        server.add_resource(TextResource(
+            uri=uri,
+            name=name,
+            description=description,
+            mime_type="text/plain",
+            text=body,
+        ))
+
+_bulk_register(mcp, _RESOURCES)
@@ -1,8 +1,66 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import time
 
 os.makedirs("logs", exist_ok=True)
 
+class BytesRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that opens the file in binary mode and writes each record
+    encoded once as bytes, bypassing the text-mode wrapper. Every record is flushed;
+    the QueueListener thread already keeps this I/O off the callers' path.
+    """
+
+    def _open(self):
+        return open(self.baseFilename, self.mode + "b")
+
+    def emit(self, record):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg.encode(self.encoding or "utf-8", self.errors or "strict"))
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+class FastFormatter(logging.Formatter):
+    """Renders the fixed "[asctime] [levelname] - message" layout with one f-string instead of %-style substitution."""
+
+    def format(self, record):
+        record.message = record.getMessage()
+        record.asctime = self.formatTime(record, self.datefmt)
+        s = f"[{record.asctime}] [{record.levelname}] - {record.message}"
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            s = f"{s}\n{record.exc_text}"
+        if record.stack_info:
+            s = f"{s}\n{self.formatStack(record.stack_info)}"
+        return s
+
+class CachedTimeFormatter(FastFormatter):
+    """FastFormatter that reuses the strftime() result for every record logged within the same second."""
+
+    _last_second = None
+    _last_stamp = ""
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_second = second
+            self._last_stamp = time.strftime(self.default_time_format, self.converter(second))
+        return f"{self._last_stamp},{int(record.msecs):03d}"
+
 logger = logging.getLogger("TradePilot")
 
 logger.setLevel(logging.INFO)
@@ -10,12 +68,25 @@ logger.setLevel(logging.INFO)
 console_handler = logging.StreamHandler()
 console_handler.setLevel(logging.INFO)
 
-file_handler = logging.FileHandler("logs/tradepilot.log")
+file_handler = BytesRotatingFileHandler(
+    "logs/tradepilot.log", maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8", delay=True,
+)
 file_handler.setLevel(logging.INFO)
 
-formatter = logging.Formatter("[%(asctime)s] [%(levelname)s] - %(message)s")
+formatter = CachedTimeFormatter()
 console_handler.setFormatter(formatter)
 file_handler.setFormatter(formatter)
 
-logger.addHandler(console_handler)
-logger.addHandler(file_handler)
+# Callers only enqueue records; a background listener thread does the console/file I/O.
+# Installed once: re-importing this module must not stack another handler and listener.
+if not logger.handlers:
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+
+    listener = logging.handlers.QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+logger.propagate = False
+
@@ -1,6 +1,45 @@
-def to_code(value, mapping):
-    if isinstance(value, int):
+import sys
+from functools import lru_cache
+
+# id(mapping) -> (mapping, case-folded copy); the mapping is kept so its id stays valid.
+_FROZEN = {}
+
+@lru_cache(maxsize=512)
+def _upper(value):
+    # Inputs come from a small fixed vocabulary ("BUY", "ioc", ...), so the
+    # upper-cased key is computed once per spelling and reused afterwards. It is
+    # interned so the probe into the (interned-key) mapping dicts hits on identity.
+    return sys.intern(value.upper())
+
+def freeze_mapping(mapping):
+    """Return a copy of `mapping` that also holds lower- and title-case spellings of each key."""
+    out = {}
+    for k, v in mapping.items():
+        out[k] = v
+        out[k.upper()] = v
+        out[k.lower()] = v
+        out[k.title()] = v
+    return out
+
+def _frozen(mapping):
+    entry = _FROZEN.get(id(mapping))
+    if entry is None or entry[0] is not mapping:
+        entry = _FROZEN[id(mapping)] = (mapping, freeze_mapping(mapping))
+    return entry[1]
+
+def to_code(value, mapping, _int=int, _str=str):
+    cls = value.__class__
+    if cls is _int:
         return value
-    elif isinstance(value, str):
-        return mapping.get(value.upper())
-    return None
\ No newline at end of file
+    if cls is _str:
+        frozen = _frozen(mapping)
+        code = frozen.get(value)
+        if code is None:
+            code = frozen.get(_upper(value))
+        return code
+    # Subclasses (IntEnum members, bool, str subclasses) take the slower path.
+    if isinstance(value, _int):
+        return value
+    if isinstance(value, _str):
+        return _frozen(mapping).get(_upper(_str(value)))
+    return None
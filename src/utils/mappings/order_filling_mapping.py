@@ -1,8 +1,19 @@
+import sys
+from types import MappingProxyType
+from typing import Final
 from utils.mt5_client import mt5
 
-ORDER_FILLING_MAP = {
-    "FOK": mt5.ORDER_FILLING_FOK,  
-    "IOC": mt5.ORDER_FILLING_IOC,
-    "BOC": mt5.ORDER_FILLING_BOC,
-    "RETURN": mt5.ORDER_FILLING_RETURN
+FILLING_FOK: Final[int] = int(mt5.ORDER_FILLING_FOK)
+FILLING_IOC: Final[int] = int(mt5.ORDER_FILLING_IOC)
+FILLING_BOC: Final[int] = int(mt5.ORDER_FILLING_BOC)
+FILLING_RETURN: Final[int] = int(mt5.ORDER_FILLING_RETURN)
+
+_ORDER_FILLING_MAP = {
+    "FOK": FILLING_FOK,
+    "IOC": FILLING_IOC,
+    "BOC": FILLING_BOC,
+    "RETURN": FILLING_RETURN,
 }
+
+# Read-only view: to_code caches a case-folded copy per mapping, which must not go stale.
+ORDER_FILLING_MAP: Final = MappingProxyType({sys.intern(k): v for k, v in _ORDER_FILLING_MAP.items()})
@@ -1,6 +1,7 @@
+import sys
 from utils.mt5_client import mt5
 
-ORDER_TYPE_MAP = {
+_ORDER_TYPE_MAP = {
     "BUY": mt5.ORDER_TYPE_BUY,
     "SELL": mt5.ORDER_TYPE_SELL,
     "BUY_LIMIT": mt5.ORDER_TYPE_BUY_LIMIT,
@@ -10,4 +11,6 @@ ORDER_TYPE_MAP = {
     "BUY_STOP_LIMIT": mt5.ORDER_TYPE_BUY_STOP_LIMIT,
     "SELL_STOP_LIMIT": mt5.ORDER_TYPE_SELL_STOP_LIMIT,
     "CLOSE_BY": mt5.ORDER_TYPE_CLOSE_BY,
-}
\ No newline at end of file
+}
+
+ORDER_TYPE_MAP = {sys.intern(k): v for k, v in _ORDER_TYPE_MAP.items()}
@@ -1,8 +1,70 @@
-import MetaTrader5 as mt5
 from utils.logger import logger
 
-mt5.initialize()
+_module = None
+# None until the implicit initialize() has been tried; False once it failed.
+_INITIALIZED = None
+# Calls that must work before (or instead of) the implicit initialize().
+_NO_INIT = frozenset({"shutdown", "last_error", "version"})
 
-if not mt5.initialize():
-    logger.error(f"MT5 initialization failed, error code: {mt5.last_error()}")
-    raise Exception("MT5 initialization failed")
\ No newline at end of file
+def _load():
+    global _module
+    if _module is None:
+        import MetaTrader5
+        _module = MetaTrader5
+    return _module
+
+def _ensure_init():
+    global _INITIALIZED
+    if _INITIALIZED:
+        return
+    if _INITIALIZED is None:
+        _INITIALIZED = bool(_load().initialize())
+        if _INITIALIZED:
+            return
+        logger.error(f"MT5 initialization failed, error code: {_load().last_error()}")
+    # A failed attempt is not retried on every attribute access; an explicit
+    # mt5.initialize() (e.g. the initialize or login tool) resets the state.
+    raise Exception("MT5 initialization failed")
+
+def _initialize(*args, **kwargs):
+    """Call MetaTrader5.initialize() and record the outcome for the implicit-init check."""
+    global _INITIALIZED
+    ok = _load().initialize(*args, **kwargs)
+    _INITIALIZED = bool(ok)
+    return ok
+
+class _LazyMT5:
+    """
+    Stand-in for the MetaTrader5 module.
+
+    Constants (ORDER_TYPE_BUY, TIMEFRAME_H1, ...) resolve without touching the terminal;
+    the first API call initializes MT5. Resolved attributes are cached on the instance.
+    """
+
+    initialize = staticmethod(_initialize)
+
+    def __getattr__(self, name):
+        # Import-machinery and copy/pickle probes (__path__, __deepcopy__, ...) must
+        # not trigger a terminal connection.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        module = _load()
+        if not name.isupper() and name not in _NO_INIT:
+            _ensure_init()
+        value = getattr(module, name)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        # Callers scan dir(mt5) for constant families (TRADE_ACTION_*, ORDER_TIME_*, ...).
+        return dir(_load())
+
+mt5 = _LazyMT5()
+
+def __getattr__(name):
+    if name.startswith("_"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(mt5, name)
+
+def __dir__():
+    return dir(_load())
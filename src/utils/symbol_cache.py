@@ -0,0 +1,33 @@
+from typing import Dict, Any
+from utils.mt5_client import mt5
+from utils.logger import logger
+
+# Per-terminal-session symbol state shared by the order tools. Both depend on the
+# connected account/server, so reset_symbol_caches() clears them on shutdown and login.
+_SELECTED: set[str] = set()
+# symbol -> MT5 symbol info; failed lookups are not stored.
+_SYMBOL_INFO: Dict[str, Any] = {}
+
+def select_symbol(symbol: str) -> bool:
+    """Add `symbol` to Market Watch once per session; return False if MT5 refuses it."""
+    if symbol in _SELECTED:
+        return True
+    if not mt5.symbol_select(symbol, True):
+        return False
+    _SELECTED.add(symbol)
+    logger.info(f"Selected symbol: {symbol}")
+    return True
+
+def symbol_info(symbol: str) -> Any:
+    """Fetch and remember a symbol's MT5 info; only static fields such as `digits` should be read from it."""
+    info = _SYMBOL_INFO.get(symbol)
+    if info is None:
+        info = mt5.symbol_info(symbol)
+        if info is not None:
+            _SYMBOL_INFO[symbol] = info
+    return info
+
+def reset_symbol_caches() -> None:
+    """Forget selected symbols and cached symbol info, e.g. after shutdown or a login to another account."""
+    _SELECTED.clear()
+    _SYMBOL_INFO.clear()